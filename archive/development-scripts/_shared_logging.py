@@ -0,0 +1,73 @@
+"""
+Shared logging setup for the development test scripts.
+
+Call configure_test_logging() to set up stdlib logging and structlog; repeat
+calls in the same process are no-ops. Records are rendered with structlog's plain console renderer, which
+is much cheaper than JSON serialization inside per-name loops; set
+LEADSCOUT_JSON_LOGS=1 to get the JSON output used for CI log collection.
+"""
+
+import logging.config
+import os
+
+import structlog
+
+logging_config = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "standard": {
+            "format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+        },
+    },
+    "handlers": {
+        "default": {
+            "level": "INFO",
+            "formatter": "standard",
+            "class": "logging.StreamHandler",
+        },
+    },
+    "loggers": {
+        "": {
+            "handlers": ["default"],
+            "level": "INFO",
+            "propagate": False
+        }
+    }
+}
+
+_CONFIGURED = False
+
+
+def configure_test_logging() -> None:
+    """Configure stdlib logging and structlog exactly once per process."""
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+
+    logging.config.dictConfig(logging_config)
+
+    if os.environ.get("LEADSCOUT_JSON_LOGS") == "1":
+        renderer = structlog.processors.JSONRenderer()
+    else:
+        renderer = structlog.dev.ConsoleRenderer(colors=False)
+
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.processors.UnicodeDecoder(),
+            renderer
+        ],
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+
+    _CONFIGURED = True
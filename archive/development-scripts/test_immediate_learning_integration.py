@@ -7,119 +7,105 @@ works correctly in the production job processing environment.
 """
 
 import asyncio
+import hashlib
 import sys
 import time
 from pathlib import Path
-import pandas as pd
 import structlog
+from openpyxl import Workbook
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from leadscout.core.resumable_job_runner import ResumableJobRunner
 
-# Configure structured logging
-logging_config = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "formatters": {
-        "standard": {
-            "format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-        },
-    },
-    "handlers": {
-        "default": {
-            "level": "INFO",
-            "formatter": "standard",
-            "class": "logging.StreamHandler",
-        },
-    },
-    "loggers": {
-        "": {
-            "handlers": ["default"],
-            "level": "INFO",
-            "propagate": False
-        }
-    }
-}
-
-import logging.config
-logging.config.dictConfig(logging_config)
-
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
-    ],
-    context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    wrapper_class=structlog.stdlib.BoundLogger,
-    cache_logger_on_first_use=True,
-)
+from _shared_logging import configure_test_logging
+
+configure_test_logging()
 
 logger = structlog.get_logger(__name__)
 
+# Column layout and constant values shared by every generated test row
+TEST_FILE_HEADERS = (
+    'EntityName', 'DirectorName', 'Keyword', 'ContactNumber', 'CellNumber',
+    'EmailAddress', 'RegisteredAddress', 'RegisteredAddressCity',
+    'RegisteredAddressProvince'
+)
+TEST_KEYWORD = 'TRANSPORT'
+TEST_CITY = 'Cape Town'
+TEST_PROVINCE = 'WESTERN CAPE'
+TEST_DATA_DIR = Path("test_data")
+
+# Names that should benefit from immediate learning patterns
+# Some will create new patterns, others should use existing patterns
+TEST_DIRECTOR_NAMES = (
+    "John Smith",           # Rule-based classification
+    "XILUVA NKOMO",         # Should create xi- pattern if LLM enabled
+    "XILANI MBEKI",         # Should use xi- pattern if created by previous name
+    "Sarah Wilson",         # Rule-based classification  
+    "RHULANI CHAUKE",       # Should create rhu- pattern if LLM enabled
+    "RHULANE SITHOLE",      # Should use rhu- pattern if created by previous name
+    "Michael Brown",        # Rule-based classification
+    "TSHIFHIWA RAMBAU",     # Complex name for testing
+    "Emma Davis",           # Rule-based classification
+    "HLUNGWANI MATHEBULA",  # Complex name for testing
+)
+
 def create_immediate_learning_test_file(file_path: Path, num_rows: int = 10) -> None:
     """Create a test Excel file optimized for immediate learning validation."""
     
-    # Names that should benefit from immediate learning patterns
-    # Some will create new patterns, others should use existing patterns
-    test_names = [
-        "John Smith",           # Rule-based classification
-        "XILUVA NKOMO",         # Should create xi- pattern if LLM enabled
-        "XILANI MBEKI",         # Should use xi- pattern if created by previous name
-        "Sarah Wilson",         # Rule-based classification  
-        "RHULANI CHAUKE",       # Should create rhu- pattern if LLM enabled
-        "RHULANE SITHOLE",      # Should use rhu- pattern if created by previous name
-        "Michael Brown",        # Rule-based classification
-        "TSHIFHIWA RAMBAU",     # Complex name for testing
-        "Emma Davis",           # Rule-based classification
-        "HLUNGWANI MATHEBULA",  # Complex name for testing
-    ]
-    
-    test_data = []
+    # Write-only mode streams rows to disk instead of holding the sheet in memory
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Sheet1")
+    append_row = sheet.append
+    append_row(TEST_FILE_HEADERS)
     for i in range(num_rows):
         # Cycle through test names
-        director_name = test_names[i % len(test_names)]
+        director_name = TEST_DIRECTOR_NAMES[i % len(TEST_DIRECTOR_NAMES)]
+        area_code = i % 9 + 1
         
-        test_data.append({
-            'EntityName': f'Immediate Learning Test Co {i+1} (Pty) Ltd',
-            'DirectorName': director_name,
-            'Keyword': 'TRANSPORT',
-            'ContactNumber': f'+27-{(i % 9 + 1):02d}{(i*10+1000):04d}',
-            'CellNumber': f'+27-{(i % 9 + 1):02d}{(i*10+2000):04d}',
-            'EmailAddress': f'director{i+1}@testcompany{i+1}.co.za',
-            'RegisteredAddress': f'{100 + i} Test Street, Test City',
-            'RegisteredAddressCity': 'Cape Town',
-            'RegisteredAddressProvince': 'WESTERN CAPE'
-        })
+        append_row((
+            f'Immediate Learning Test Co {i+1} (Pty) Ltd',
+            director_name,
+            TEST_KEYWORD,
+            f'+27-{area_code:02d}{(i*10+1000):04d}',
+            f'+27-{area_code:02d}{(i*10+2000):04d}',
+            f'director{i+1}@testcompany{i+1}.co.za',
+            f'{100 + i} Test Street, Test City',
+            TEST_CITY,
+            TEST_PROVINCE
+        ))
     
-    df = pd.DataFrame(test_data)
-    df.to_excel(file_path, index=False)
+    workbook.save(file_path)
     logger.info("Immediate learning test file created", 
                file_path=str(file_path), 
                rows=num_rows,
                test_type="immediate_learning")
 
-async def test_immediate_learning_with_job_runner():
+def ensure_fixtures(num_rows: int = 10) -> Path:
+    """Return the test workbook, generating it only when its inputs changed.
+
+    The file name carries a hash of everything that goes into the rows, so an
+    existing file with that name is already up to date and is reused.
+    """
+    fingerprint = hashlib.sha256(repr((
+        TEST_FILE_HEADERS, TEST_DIRECTOR_NAMES, TEST_KEYWORD,
+        TEST_CITY, TEST_PROVINCE, num_rows
+    )).encode()).hexdigest()[:12]
+    test_file = TEST_DATA_DIR / f"immediate_learning_test_{fingerprint}.xlsx"
+
+    if test_file.exists():
+        logger.info("Reusing immediate learning test file", file_path=str(test_file))
+    else:
+        TEST_DATA_DIR.mkdir(exist_ok=True)
+        create_immediate_learning_test_file(test_file, num_rows)
+
+    return test_file
+
+async def test_immediate_learning_with_job_runner(test_file: Path):
     """Test immediate learning integration with ResumableJobRunner."""
     logger.info("🧪 Testing immediate learning with ResumableJobRunner")
     
-    # Create test directories
-    Path("test_data").mkdir(exist_ok=True)
-    Path("cache").mkdir(exist_ok=True)
-    
-    # Create test file
-    test_file = Path("test_data/immediate_learning_test.xlsx")
-    create_immediate_learning_test_file(test_file, 10)
-    
     # Initialize job runner with small batch size for detailed tracking
     runner = ResumableJobRunner(
         input_file=test_file,
@@ -134,9 +120,9 @@ async def test_immediate_learning_with_job_runner():
                    initial_llm_calls=initial_stats.get('total_llm_classifications', 0))
     
     # Run the job
-    start_time = time.time()
+    start_time = time.perf_counter()
     job_id = await runner.run()
-    elapsed_time = time.time() - start_time
+    elapsed_time = time.perf_counter() - start_time
     
     # Check final learning database state
     if hasattr(runner, 'classifier') and hasattr(runner.classifier, 'learning_db'):
@@ -176,7 +162,8 @@ async def main():
     logger.info("🚀 Starting immediate learning integration test")
     
     try:
-        job_id, immediate_learning_active = await test_immediate_learning_with_job_runner()
+        test_file = ensure_fixtures()
+        job_id, immediate_learning_active = await test_immediate_learning_with_job_runner(test_file)
         
         if immediate_learning_active:
             logger.info("🎉 IMMEDIATE LEARNING INTEGRATION TEST PASSED!")
@@ -201,9 +188,7 @@ async def main():
             return False
             
     except Exception as e:
-        logger.error("❌ Integration test failed", error=str(e))
-        import traceback
-        traceback.print_exc()
+        logger.error("❌ Integration test failed", error=str(e), exc_info=True)
         return False
 
 if __name__ == "__main__":
@@ -21,13 +21,34 @@ for lead scoring, supports async batch processing.
 
 import asyncio
 import logging
+import re
 import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Union
+from functools import lru_cache
+from typing import (
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from leadscout.core.config import get_settings
 
+# Import phonetic algorithms
+try:
+    import jellyfish
+
+    JELLYFISH_AVAILABLE = True
+except ImportError:
+    JELLYFISH_AVAILABLE = False
+
 from .dictionaries import EthnicityType
 from .exceptions import (
     BatchProcessingError,
@@ -52,8 +73,149 @@ from .rules import RuleBasedClassifier
 
 logger = logging.getLogger(__name__)
 
+# South African linguistic markers keyed by the name prefix that signals them.
+# The prefixes are mutually exclusive, so a name has at most one prefix marker.
+SA_PREFIX_PATTERNS: Dict[str, str] = {
+    "HL": "tsonga_hl_prefix",  # HLUNGWANI
+    "NX": "click_consonant",  # NXANGUMUNI
+    "MK": "zulu_mk_pattern",  # MKHABELA
+    "MUL": "venda_mul_prefix",  # MULAUDZI
+    "MMA": "tswana_mma_prefix",  # MMATSHEPO
+    "MAB": "sotho_ma_pattern",  # MABENA
+    "MAG": "sotho_ma_pattern",
+    "MAK": "sotho_ma_pattern",
+    "MAM": "sotho_ma_pattern",
+}
+
+# Markers that may appear anywhere in the name
+SA_INFIX_PATTERNS: Tuple[Tuple[str, str], ...] = (
+    ("VH", "venda_vh_pattern"),  # TSHIVHASE
+    ("NGU", "bantu_ngu_pattern"),  # NGUBANE
+)
+
+# Both tables compiled into one alternation so a single regex scan finds every
+# marker; prefixes are anchored and tried longest first
+_SA_PATTERN_RE = re.compile(
+    "^(?:"
+    + "|".join(sorted(SA_PREFIX_PATTERNS, key=len, reverse=True))
+    + ")|"
+    + "|".join(infix for infix, _ in SA_INFIX_PATTERNS)
+)
+_SA_PATTERN_TAGS: Dict[str, str] = {**SA_PREFIX_PATTERNS, **dict(SA_INFIX_PATTERNS)}
+
+# Distinct names whose learning features are memoized. The helpers below are
+# pure functions of the name, and directors repeat across companies and jobs.
+LEARNING_FEATURE_CACHE_SIZE = 50_000
+
+# Minimum confidence a layer must reach when high confidence is required
+HIGH_CONFIDENCE_THRESHOLD = 0.85
+
+# Byte classes for structural features: 1 for a vowel, 2 for a consonant and
+# 0 otherwise, in either case. Translating the encoded name classifies every
+# character in one C-level pass.
+_VOWEL_CLASS = 1
+_CONSONANT_CLASS = 2
+_LETTER_CLASS_TABLE = bytes(
+    _VOWEL_CLASS
+    if chr(i) in "AEIOUaeiou"
+    else _CONSONANT_CLASS
+    if chr(i) in "BCDFGHJKLMNPQRSTVWXYZbcdfghjklmnpqrstvwxyz"
+    else 0
+    for i in range(256)
+)
+
+
+@lru_cache(maxsize=LEARNING_FEATURE_CACHE_SIZE)
+def _normalize_name_for_phonetics(name: str) -> str:
+    """Normalize name for phonetic algorithms that require alphabetical characters only."""
+    # Remove common prefixes/suffixes that can interfere
+    normalized = name.strip().lower()
+
+    # Handle South African specific patterns
+    # Remove common prefixes
+    prefixes_to_remove = ["van der ", "van ", "de ", "du ", "le "]
+    for prefix in prefixes_to_remove:
+        if normalized.startswith(prefix):
+            normalized = normalized[len(prefix) :]
+            break
+
+    # Handle apostrophes (common in some SA names)
+    normalized = normalized.replace("'", "")
+
+    # Remove hyphens and spaces for core phonetic matching
+    normalized = normalized.replace("-", "").replace(" ", "")
+
+    # Ensure we have something to work with
+    if not normalized:
+        normalized = name.strip().replace(" ", "")
+
+    return normalized
+
+
+@lru_cache(maxsize=LEARNING_FEATURE_CACHE_SIZE)
+def _phonetic_codes_for_learning(normalized_name: str) -> Tuple[str, str, str, str]:
+    """Return (soundex, metaphone, nysiis, match_rating_codex) for a normalized name."""
+    # Note: jellyfish doesn't have double_metaphone, only metaphone
+    return (
+        jellyfish.soundex(normalized_name),
+        jellyfish.metaphone(normalized_name),
+        jellyfish.nysiis(normalized_name),
+        jellyfish.match_rating_codex(normalized_name),
+    )
+
 
-@dataclass
+@lru_cache(maxsize=LEARNING_FEATURE_CACHE_SIZE)
+def _sa_linguistic_patterns(name_upper: str) -> Tuple[str, ...]:
+    """Return the South African linguistic markers for an upper-cased name."""
+    # A repeated infix is reported once, in order of first appearance
+    matches = dict.fromkeys(_SA_PATTERN_RE.findall(name_upper))
+    return tuple(_SA_PATTERN_TAGS[match] for match in matches)
+
+
+@dataclass(frozen=True, slots=True)
+class _NameForms:
+    """Case variants of a name, computed once and shared by the learning helpers."""
+
+    name: str
+    lower: str
+    upper: str
+
+    @classmethod
+    def of(cls, name: Union[str, "_NameForms"]) -> "_NameForms":
+        """Return the forms of a name, reusing them if already computed."""
+        if isinstance(name, _NameForms):
+            return name
+        return cls(name, name.lower(), name.upper())
+
+
+def _effective_threshold(threshold: float, require_high_confidence: bool) -> float:
+    """Return a layer's acceptance threshold, raised to the high-confidence floor."""
+    if require_high_confidence and threshold < HIGH_CONFIDENCE_THRESHOLD:
+        return HIGH_CONFIDENCE_THRESHOLD
+    return threshold
+
+
+# Whether the .env file has been read into the environment in this process
+_DOTENV_LOADED = False
+
+
+def _load_dotenv_once() -> None:
+    """Load the .env file the first time LLM settings are needed."""
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    _DOTENV_LOADED = True
+
+
+# Most recent layer errors kept per session; older messages are only counted
+SESSION_ERROR_HISTORY = 100
+
+
+@dataclass(slots=True)
 class ClassificationSession:
     """Tracking data for a classification session."""
 
@@ -64,12 +226,21 @@ class ClassificationSession:
     cache_hits: int = 0
     learned_hits: int = 0  # NEW: Learned pattern matches
     llm_learning_stores: int = 0  # NEW: LLM results stored for learning
-    total_time_ms: float = 0.0
-    rule_time_ms: float = 0.0
-    phonetic_time_ms: float = 0.0
-    llm_time_ms: float = 0.0
+    # Layer timings in integer nanoseconds; converted to ms for reporting
+    total_time_ns: int = 0
+    rule_time_ns: int = 0
+    phonetic_time_ns: int = 0
+    llm_time_ns: int = 0
     llm_cost_usd: float = 0.0
-    errors: List[str] = field(default_factory=list)
+    error_count: int = 0
+    errors: Deque[str] = field(
+        default_factory=lambda: deque(maxlen=SESSION_ERROR_HISTORY)
+    )
+
+    def record_error(self, message: str) -> None:
+        """Count a layer error and keep its message in the recent history."""
+        self.error_count += 1
+        self.errors.append(message)
 
 
 class NameClassifier:
@@ -87,6 +258,10 @@ class NameClassifier:
     layers, ensuring optimal performance and cost efficiency.
     """
 
+    # Bounds for skipping repeat learning stores of the same name
+    RECENTLY_STORED_MAX_SIZE = 10_000
+    RECENTLY_STORED_TTL_SECONDS = 60.0
+
     def __init__(
         self,
         rule_confidence_threshold: float = 0.8,
@@ -121,7 +296,7 @@ class NameClassifier:
         self.llm_classifier: Optional[LLMClassifier] = None
         if self._llm_enabled:
             try:
-                # Get API keys from config
+                # Get API keys from config (get_settings() is cached per process)
                 settings = get_settings()
                 claude_key = settings.get_anthropic_key()
                 openai_key = settings.get_openai_key()
@@ -146,6 +321,11 @@ class NameClassifier:
         # Removed: self._pending_learning_records (no longer needed)
         self._immediate_learning_enabled = True
 
+        # Normalized names recently sent to the learning database, with the
+        # monotonic time they were stored. Repeat LLM hits for the same name
+        # (duplicate director rows in flight together) are not stored twice.
+        self._recently_stored: "OrderedDict[str, float]" = OrderedDict()
+
         # Cache integration (placeholder for Developer A's cache system)
         self.cache: Optional[ClassificationCache] = None
 
@@ -181,7 +361,7 @@ class NameClassifier:
             raise_invalid_name(name or "", "Empty or whitespace-only name")
 
         name = name.strip()
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Check cache first (if enabled and available)
@@ -192,113 +372,320 @@ class NameClassifier:
                     self.current_session.names_processed += 1
                     return cached_result
 
-            result = None
+            hit, result, learned_lookup = await self._classify_local_layers(
+                name, require_high_confidence, overlap_learned_lookup=True
+            )
+            if hit:
+                return hit
 
-            # Layer 1: Rule-based classification
-            rule_start = time.time()
-            try:
-                result = self.rule_classifier.classify_name(name)
-                rule_time = (time.time() - rule_start) * 1000
-                self.current_session.rule_time_ms += rule_time
-
-                if result and result.confidence >= self.rule_confidence_threshold:
-                    if require_high_confidence and result.confidence < 0.85:
-                        # Continue to next layer for higher confidence
-                        pass
-                    else:
-                        self.current_session.rule_hits += 1
-                        await self._cache_result(name, result)
-                        return result
+            return await self._classify_fallback_layers(
+                name, context, require_high_confidence, result, learned_lookup
+            )
 
-            except Exception as e:
-                logger.warning(f"Rule-based classification failed for '{name}': {e}")
-                self.current_session.errors.append(f"Rule error: {str(e)[:100]}")
+        finally:
+            self.current_session.total_time_ns += time.perf_counter_ns() - start_ns
+            self.current_session.names_processed += 1
 
-            # Layer 2: Phonetic classification
-            phonetic_start = time.time()
-            try:
-                result = await self.phonetic_classifier.classify_name(name)
-                phonetic_time = (time.time() - phonetic_start) * 1000
-                self.current_session.phonetic_time_ms += phonetic_time
-
-                if result and result.confidence >= self.phonetic_confidence_threshold:
-                    if require_high_confidence and result.confidence < 0.85:
-                        # Continue to LLM for higher confidence
-                        pass
-                    else:
-                        self.current_session.phonetic_hits += 1
-                        await self._cache_result(name, result)
-                        return result
+    async def _classify_local_layers(
+        self,
+        name: str,
+        require_high_confidence: bool,
+        overlap_learned_lookup: bool = False,
+    ) -> Tuple[
+        Optional[Classification], Optional[Classification], Optional[asyncio.Future]
+    ]:
+        """Run the in-process rule-based and phonetic layers for a stripped name.
 
-            except Exception as e:
-                logger.warning(f"Phonetic classification failed for '{name}': {e}")
-                self.current_session.errors.append(f"Phonetic error: {str(e)[:100]}")
+        Args:
+            name: Stripped name to classify
+            require_high_confidence: If True, only accept high-confidence results
+            overlap_learned_lookup: Start the learned-pattern lookup before the
+                phonetic layer so the two overlap
 
-            # NEW: Layer 2.5 - Check learned patterns BEFORE LLM fallback
-            try:
-                learned_result = self.learning_db.find_learned_classification(name)
-                if learned_result and learned_result.confidence >= 0.6:
-                    self.current_session.learned_hits += 1
-                    logger.info(
-                        "Learned pattern match found",
-                        extra={
-                            "pattern_name": name,
-                            "pattern_ethnicity": learned_result.ethnicity.value,
-                            "pattern_confidence": learned_result.confidence,
-                        },
-                    )
-                    await self._cache_result(name, learned_result)
-                    return learned_result
-            except Exception as e:
-                logger.warning(f"Learned pattern lookup failed for '{name}': {e}")
+        Returns:
+            Tuple of (accepted result or None, last layer result for error
+            reporting, pending learned lookup started for the fallback layers)
+        """
+        result = None
 
-            # Layer 3: LLM classification (if enabled and within cost limits)
-            if (
-                self._llm_enabled
-                and self.llm_classifier
-                and self.current_session.llm_cost_usd < self.max_llm_cost_per_session
-            ):
-                llm_start = time.time()
-                try:
-                    result = await self.llm_classifier.classify_name(name, context)
-                    llm_time = (time.time() - llm_start) * 1000
-                    self.current_session.llm_time_ms += llm_time
-
-                    # Track LLM cost
-                    if hasattr(result, "llm_details") and result.llm_details:
-                        cost = getattr(result.llm_details, "cost_usd", None) or getattr(
-                            result.llm_details, "total_cost", 0.0
-                        )
-                        self.current_session.llm_cost_usd += cost
+        # Specialized once per call, so each layer's hit check is one comparison
+        rule_threshold = _effective_threshold(
+            self.rule_confidence_threshold, require_high_confidence
+        )
+        phonetic_threshold = _effective_threshold(
+            self.phonetic_confidence_threshold, require_high_confidence
+        )
 
-                    if result and result.confidence >= self.llm_confidence_threshold:
-                        # ENHANCEMENT 1: Immediate learning storage for real-time pattern availability
-                        try:
-                            self._store_llm_classification_immediately(name, result)
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to immediately store learning data for '{name}': {e}"
-                            )
+        # Layer 1: Rule-based classification
+        rule_start_ns = time.perf_counter_ns()
+        try:
+            result = self.rule_classifier.classify_name(name)
+            self.current_session.rule_time_ns += time.perf_counter_ns() - rule_start_ns
 
-                        self.current_session.llm_hits += 1
-                        await self._cache_result(name, result)
-                        return result
+            if result is not None and result.confidence >= rule_threshold:
+                self.current_session.rule_hits += 1
+                await self._cache_result(name, result)
+                return result, result, None
 
-                except Exception as e:
-                    logger.warning(f"LLM classification failed for '{name}': {e}")
-                    self.current_session.errors.append(f"LLM error: {str(e)[:100]}")
+        except Exception as e:
+            logger.warning(f"Rule-based classification failed for '{name}': {e}")
+            self.current_session.record_error(f"Rule error: {str(e)[:100]}")
+
+        # Layer 2.5 only needs the name, so its SQLite lookup can start in a
+        # worker thread now and overlap the phonetic layer. Its result is
+        # only used if the phonetic layer does not produce a hit.
+        learned_lookup = None
+        if overlap_learned_lookup:
+            learned_lookup = self._start_learned_lookup(name)
+
+        # Layer 2: Phonetic classification
+        phonetic_start_ns = time.perf_counter_ns()
+        try:
+            result = await self.phonetic_classifier.classify_name(name)
+            self.current_session.phonetic_time_ns += (
+                time.perf_counter_ns() - phonetic_start_ns
+            )
+
+            if result is not None and result.confidence >= phonetic_threshold:
+                if learned_lookup:
+                    learned_lookup.cancel()
+                self.current_session.phonetic_hits += 1
+                await self._cache_result(name, result)
+                return result, result, None
+
+        except Exception as e:
+            logger.warning(f"Phonetic classification failed for '{name}': {e}")
+            self.current_session.record_error(f"Phonetic error: {str(e)[:100]}")
+
+        return None, result, learned_lookup
+
+    async def _classify_fallback_layers(
+        self,
+        name: str,
+        context: Optional[Dict[str, str]],
+        require_high_confidence: bool,
+        result: Optional[Classification],
+        learned_lookup: Optional[asyncio.Future] = None,
+    ) -> Optional[Classification]:
+        """Run the learned-pattern and LLM layers for a name layers 1-2 missed.
 
-            # No classification possible
-            if require_high_confidence:
-                confidence = result.confidence if result else 0.0
-                raise_low_confidence(name, "multi-layer", confidence, 0.85)
+        Args:
+            name: Stripped name to classify
+            context: Additional context passed to the LLM
+            require_high_confidence: If True, only return high-confidence results
+            result: Last result from the earlier layers, for error reporting
+            learned_lookup: Learned lookup already started, if any
+        """
+        # NEW: Layer 2.5 - Check learned patterns BEFORE LLM fallback
+        if learned_lookup is None:
+            learned_lookup = self._start_learned_lookup(name)
+        try:
+            learned_result = await self._accept_learned_result(
+                name, await learned_lookup, record_access=True
+            )
+            if learned_result:
+                return learned_result
+        except Exception as e:
+            logger.warning(f"Learned pattern lookup failed for '{name}': {e}")
+
+        # Layer 3: LLM classification (if enabled and within cost limits)
+        llm_result, raw_llm_result = await self._classify_llm_layer(
+            name, context, require_high_confidence
+        )
+        if llm_result:
+            return llm_result
+        if raw_llm_result:
+            result = raw_llm_result
+
+        # No classification possible
+        if require_high_confidence:
+            confidence = result.confidence if result else 0.0
+            raise_low_confidence(
+                name, "multi-layer", confidence, HIGH_CONFIDENCE_THRESHOLD
+            )
+
+        return None
+
+    async def _accept_learned_result(
+        self,
+        name: str,
+        learned_result: Optional[Classification],
+        record_access: bool = False,
+    ) -> Optional[Classification]:
+        """Accept a learned-pattern lookup result if it is confident enough.
 
+        Args:
+            name: Stripped name that was looked up
+            learned_result: Lookup result, if any
+            record_access: The lookup came from _start_learned_lookup, which
+                leaves a direct cache hit uncounted until it is accepted here
+        """
+        if not learned_result or learned_result.confidence < 0.6:
             return None
 
+        if record_access and learned_result.method == ClassificationMethod.CACHE:
+            self.learning_db.record_cache_access(name.lower())
+
+        self.current_session.learned_hits += 1
+        logger.info(
+            "Learned pattern match found",
+            extra={
+                "pattern_name": name,
+                "pattern_ethnicity": learned_result.ethnicity.value,
+                "pattern_confidence": learned_result.confidence,
+            },
+        )
+        await self._cache_result(name, learned_result)
+        return learned_result
+
+    async def _classify_llm_layer(
+        self,
+        name: str,
+        context: Optional[Dict[str, str]],
+        require_high_confidence: bool = False,
+    ) -> Tuple[Optional[Classification], Optional[Classification]]:
+        """Run the LLM layer for a stripped name, if enabled and within budget.
+
+        Args:
+            name: Stripped name to classify
+            context: Additional context passed to the LLM
+            require_high_confidence: If True, only accept high-confidence results
+
+        Returns:
+            Tuple of (accepted result or None, raw LLM result for error reporting)
+        """
+        if not (
+            self._llm_enabled
+            and self.llm_classifier
+            and self.current_session.llm_cost_usd < self.max_llm_cost_per_session
+        ):
+            return None, None
+
+        llm_start_ns = time.perf_counter_ns()
+        try:
+            result = await self.llm_classifier.classify_name(name, context)
+            self.current_session.llm_time_ns += time.perf_counter_ns() - llm_start_ns
+
+            # Track LLM cost
+            if hasattr(result, "llm_details") and result.llm_details:
+                cost = getattr(result.llm_details, "cost_usd", None) or getattr(
+                    result.llm_details, "total_cost", 0.0
+                )
+                self.current_session.llm_cost_usd += cost
+
+            llm_threshold = _effective_threshold(
+                self.llm_confidence_threshold, require_high_confidence
+            )
+            if result is not None and result.confidence >= llm_threshold:
+                # ENHANCEMENT 1: Immediate learning storage for real-time pattern availability
+                try:
+                    await self._store_llm_classification_in_thread(name, result)
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to immediately store learning data for '{name}': {e}"
+                    )
+
+                self.current_session.llm_hits += 1
+                await self._cache_result(name, result)
+                return result, result
+
+            return None, result
+
+        except Exception as e:
+            logger.warning(f"LLM classification failed for '{name}': {e}")
+            self.current_session.record_error(f"LLM error: {str(e)[:100]}")
+            return None, None
+
+    async def classify_llm_batch(
+        self,
+        names: List[str],
+        context: Optional[Dict[str, str]] = None,
+        max_concurrent: int = 10,
+    ) -> List[Optional[Classification]]:
+        """Run the LLM layer concurrently over names the other layers missed.
+
+        Args:
+            names: Stripped names to send to the LLM
+            context: Shared context for all names
+            max_concurrent: Maximum concurrent LLM requests
+
+        Returns:
+            Accepted LLM results (same order as input), None where the LLM was
+            unavailable, over budget or below its confidence threshold. A name
+            covered by patterns learned from earlier names in the batch gets
+            its learned result instead of an LLM call.
+        """
+        results: List[Optional[Classification]] = [None] * len(names)
+        async for index, result in self._stream_llm_layer(
+            names, context, max_concurrent
+        ):
+            results[index] = result
+        return results
+
+    async def _stream_llm_layer(
+        self,
+        names: List[str],
+        context: Optional[Dict[str, str]],
+        max_concurrent: int,
+    ) -> AsyncIterator[Tuple[int, Optional[Classification]]]:
+        """Run the LLM layer with a worker pool, yielding results as they finish.
+
+        Workers pull names from one shared iterator, so only max_concurrent
+        coroutines exist at a time however large the batch is. The bounded
+        queue stops workers from running ahead of a slow consumer.
+
+        Once an LLM result has been stored for learning, each later name is
+        looked up in the learned patterns again before its LLM call, so names
+        sharing a prefix or phonetic family with an earlier one are answered
+        without another LLM request.
+        """
+        finished: asyncio.Queue = asyncio.Queue(maxsize=max(max_concurrent, 1))
+        pending = iter(enumerate(names))
+        stores_before = self.current_session.llm_learning_stores
+
+        async def worker() -> None:
+            for index, name in pending:
+                try:
+                    result = None
+                    if self.current_session.llm_learning_stores != stores_before:
+                        result = await self._accept_learned_result(
+                            name,
+                            await self._start_learned_lookup(name),
+                            record_access=True,
+                        )
+                    if result is None:
+                        result, _ = await self._classify_llm_layer(name, context)
+                except Exception as e:
+                    logger.error(f"Failed to classify '{name}' with LLM: {e}")
+                    result = None
+                await finished.put((index, result))
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(max_concurrent, len(names)))
+        ]
+        try:
+            for _ in range(len(names)):
+                yield await finished.get()
         finally:
-            total_time = (time.time() - start_time) * 1000
-            self.current_session.total_time_ms += total_time
-            self.current_session.names_processed += 1
+            for task in workers:
+                task.cancel()
+
+    def _start_learned_lookup(self, name: str) -> asyncio.Future:
+        """Start the synchronous learned-pattern lookup in a worker thread.
+
+        The lookup is handed to the executor before this returns, so it runs
+        while the caller keeps the event loop busy with the phonetic layer.
+        A running lookup cannot be cancelled, so it does not write: a direct
+        cache hit is only counted once _accept_learned_result() uses it.
+        """
+        return asyncio.get_running_loop().run_in_executor(
+            None,
+            self.learning_db.find_learned_classification,
+            name,
+            name.lower(),
+            False,
+        )
 
     async def classify_batch(
         self,
@@ -309,6 +696,9 @@ class NameClassifier:
     ) -> List[Optional[Classification]]:
         """Classify a batch of names concurrently.
 
+        Names that match after stripping and lower-casing are classified once;
+        each position still gets a result carrying its own spelling.
+
         Args:
             names: List of names to classify
             context: Shared context for all names
@@ -325,46 +715,21 @@ class NameClassifier:
             return []
 
         logger.info(f"Starting batch classification of {len(names)} names")
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def classify_with_semaphore(
-            name: str, index: int
-        ) -> tuple[int, Optional[Classification]]:
-            async with semaphore:
-                try:
-                    result = await self.classify_name(name, context)
-                    if progress_callback:
-                        progress_callback(index + 1, len(names))
-                    return index, result
-                except Exception as e:
-                    logger.error(f"Failed to classify '{name}' at index {index}: {e}")
-                    return index, None
+        results: List[Optional[Classification]] = [None] * len(names)
 
         try:
-            # Process all names concurrently
-            tasks = [classify_with_semaphore(name, i) for i, name in enumerate(names)]
-
-            completed_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Sort results back to original order
-            results = [None] * len(names)
-            failed_count = 0
-
-            for result in completed_results:
-                if isinstance(result, Exception):
-                    failed_count += 1
-                    continue
-
-                index, classification = result
+            completed = 0
+            async for index, classification in self.classify_stream(
+                names, context, max_concurrent
+            ):
                 results[index] = classification
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, len(names))
 
-            if failed_count > 0:
-                logger.warning(
-                    f"Batch processing completed with {failed_count} failures"
-                )
-
+            classified_count = sum(result is not None for result in results)
             logger.info(
-                f"Batch classification completed: {len(names) - failed_count}/{len(names)} successful"
+                f"Batch classification completed: {classified_count}/{len(names)} classified"
             )
             return results
 
@@ -379,6 +744,141 @@ class NameClassifier:
                 failed_names=failed_names[:10],  # Limit to first 10 for readability
             ) from e
 
+    async def classify_stream(
+        self,
+        names: List[str],
+        context: Optional[Dict[str, str]] = None,
+        max_concurrent: int = 10,
+    ) -> AsyncIterator[Tuple[int, Optional[Classification]]]:
+        """Classify a batch of names, yielding each result as soon as it is known.
+
+        Names resolved by the cache, rule-based and phonetic layers come first,
+        then learned-pattern matches, then LLM results in completion order, so
+        callers can write results out while the LLM tail is still running.
+
+        Names that match after stripping and lower-casing are classified once;
+        each position still gets a result carrying its own spelling.
+
+        Args:
+            names: List of names to classify
+            context: Shared context for all names
+            max_concurrent: Maximum concurrent LLM requests
+
+        Yields:
+            Tuple of (index into names, classification or None) for every name
+        """
+        # Director data repeats the same person across many companies, so each
+        # distinct name is classified once and its result fanned back out
+        positions: Dict[str, List[int]] = {}
+        for index, raw_name in enumerate(names):
+            positions.setdefault((raw_name or "").strip().lower(), []).append(index)
+        unique_positions = list(positions.values())
+        unique_names = [names[indices[0]] for indices in unique_positions]
+
+        def fan_out(
+            unique_index: int, classification: Optional[Classification]
+        ) -> Iterator[Tuple[int, Optional[Classification]]]:
+            for index in unique_positions[unique_index]:
+                result = classification
+                if result is not None and names[index].strip() != result.name:
+                    result = result.model_copy(update={"name": names[index].strip()})
+                yield index, result
+
+        # Layers 1-2 are CPU-bound, so they run over the whole batch in one
+        # pass; only names they cannot resolve reach the later layers
+        resolved, unresolved = await self._resolve_cpu_layers(unique_names)
+        for unique_index, classification in resolved.items():
+            for item in fan_out(unique_index, classification):
+                yield item
+
+        # Layer 2.5: one bulk lookup in a worker thread resolves every
+        # remaining name with chunked IN (...) queries
+        start_ns = time.perf_counter_ns()
+        learned_lookups = (
+            await asyncio.to_thread(
+                self.learning_db.find_learned_classifications_bulk,
+                [name for _, name, _ in unresolved],
+            )
+            if unresolved
+            else {}
+        )
+        llm_candidates: List[Tuple[int, str]] = []
+        for unique_index, name, _ in unresolved:
+            learned_result = await self._accept_learned_result(
+                name, learned_lookups.get(name)
+            )
+            if learned_result:
+                for item in fan_out(unique_index, learned_result):
+                    yield item
+            else:
+                llm_candidates.append((unique_index, name))
+
+        # Layer 3: one concurrent LLM pass over everything still unresolved
+        async for position, classification in self._stream_llm_layer(
+            [name for _, name in llm_candidates], context, max_concurrent
+        ):
+            for item in fan_out(llm_candidates[position][0], classification):
+                yield item
+
+        self.current_session.total_time_ns += time.perf_counter_ns() - start_ns
+        self.current_session.names_processed += len(unresolved)
+
+    async def _resolve_cpu_layers(
+        self, names: List[str]
+    ) -> Tuple[
+        Dict[int, Optional[Classification]],
+        List[Tuple[int, str, Optional[Classification]]],
+    ]:
+        """Run cache, rule-based and phonetic layers over a batch in one pass.
+
+        None of these layers wait on I/O, so running them back to back avoids
+        scheduling a task per name for the names they resolve.
+
+        Returns:
+            Tuple of (index -> result for resolved or invalid names, list of
+            (index, stripped name, last layer result) still needing layers 2.5+)
+        """
+        resolved: Dict[int, Optional[Classification]] = {}
+        unresolved: List[Tuple[int, str, Optional[Classification]]] = []
+
+        for index, raw_name in enumerate(names):
+            if not raw_name or not raw_name.strip():
+                logger.error(
+                    f"Failed to classify '{raw_name}' at index {index}: "
+                    "Empty or whitespace-only name"
+                )
+                resolved[index] = None
+                continue
+
+            name = raw_name.strip()
+            start_ns = time.perf_counter_ns()
+            try:
+                hit = None
+                if self.enable_caching and self.cache:
+                    hit = await self._check_cache(name)
+                    if hit:
+                        self.current_session.cache_hits += 1
+
+                if not hit:
+                    hit, result, _ = await self._classify_local_layers(name, False)
+                    if not hit:
+                        unresolved.append((index, name, result))
+                        continue
+
+                resolved[index] = hit
+
+            except Exception as e:
+                logger.error(f"Failed to classify '{name}' at index {index}: {e}")
+                resolved[index] = None
+
+            finally:
+                self.current_session.total_time_ns += time.perf_counter_ns() - start_ns
+                # Unresolved names are counted once their fallback layers finish
+                if index in resolved:
+                    self.current_session.names_processed += 1
+
+        return resolved, unresolved
+
     async def _check_cache(self, name: str) -> Optional[Classification]:
         """Check cache for existing classification (placeholder for Developer A's cache)."""
         # TODO: Integrate with Developer A's cache system
@@ -401,26 +901,118 @@ class NameClassifier:
         - Eliminates complex flush mechanisms
         """
 
-        if classification.confidence < 0.5:  # Lower threshold for learning (was 0.8)
+        forms = self._claim_learning_store(name, classification)
+        if forms is None:
+            return
+
+        try:
+            # IMMEDIATE STORAGE: Store directly to database (no queuing)
+            record, success = self._build_and_store_learning_record(
+                forms, classification
+            )
+            if record is not None:
+                self._log_learning_store(record, success)
+
+        except Exception as e:
+            self._recently_stored.pop(forms.lower.strip(), None)
+            logger.error(
+                "Failed to immediately store LLM classification for learning",
+                extra={"failed_name": name, "error": str(e)},
+            )
+
+    async def _store_llm_classification_in_thread(
+        self, name: str, classification: Classification
+    ):
+        """Store an LLM classification with feature extraction and the write in a thread.
+
+        Same immediate-learning guarantee as _store_llm_classification_immediately:
+        the caller awaits the write before returning the result, but other
+        classifications keep running on the event loop while the learning
+        features are built and SQLite commits. Only the cheap skip checks run
+        on the event loop.
+        """
+
+        forms = self._claim_learning_store(name, classification)
+        if forms is None:
+            return
+
+        try:
+            record, success = await asyncio.to_thread(
+                self._build_and_store_learning_record, forms, classification
+            )
+            if record is not None:
+                self._log_learning_store(record, success)
+
+        except Exception as e:
+            self._recently_stored.pop(forms.lower.strip(), None)
+            logger.error(
+                "Failed to immediately store LLM classification for learning",
+                extra={"failed_name": name, "error": str(e)},
+            )
+
+    def _claim_learning_store(
+        self, name: str, classification: Classification
+    ) -> Optional[_NameForms]:
+        """Decide whether an LLM result should be stored and claim it if so.
+
+        Returns:
+            The name's case forms if the caller should build and store the
+            record, or None if the result is not worth storing
+        """
+
+        # The learning database would not store it anyway, so skip building it
+        if classification.confidence < self.learning_db.min_store_confidence:
             logger.debug(
                 f"Skipping learning storage - confidence too low: {classification.confidence}"
             )
-            return
+            return None
+
+        forms = _NameForms.of(name)
+        normalized_name = forms.lower.strip()
+        now = time.monotonic()
+        stored_at = self._recently_stored.get(normalized_name)
+        if stored_at is not None and now - stored_at < self.RECENTLY_STORED_TTL_SECONDS:
+            logger.debug(f"Skipping learning storage - '{name}' stored recently")
+            return None
+
+        # Claimed before the write so a concurrent duplicate skips it too
+        self._recently_stored[normalized_name] = now
+        self._recently_stored.move_to_end(normalized_name)
+        if len(self._recently_stored) > self.RECENTLY_STORED_MAX_SIZE:
+            self._recently_stored.popitem(last=False)
+
+        return forms
+
+    def _build_and_store_learning_record(
+        self, forms: _NameForms, classification: Classification
+    ) -> Tuple[Optional[LLMClassificationRecord], bool]:
+        """Build the learning record for a claimed LLM result and write it."""
+        record = self._build_learning_record(forms, classification)
+        if record is None:
+            return None, False
+        return record, self.learning_db.store_llm_classification(record)
+
+    def _build_learning_record(
+        self, name: Union[str, _NameForms], classification: Classification
+    ) -> Optional[LLMClassificationRecord]:
+        """Build the learning record for a claimed LLM result, or None on failure."""
+
+        forms = _NameForms.of(name)
+        normalized_name = forms.lower.strip()
 
         try:
             # Extract phonetic codes using existing phonetic system
-            phonetic_codes = self._extract_phonetic_codes_for_learning(name)
+            phonetic_codes = self._extract_phonetic_codes_for_learning(forms.name)
 
             # Detect linguistic patterns using SA patterns
-            linguistic_patterns = self._detect_sa_linguistic_patterns(name)
+            linguistic_patterns = self._detect_sa_linguistic_patterns(forms)
 
             # Extract structural features
-            structural_features = self._extract_structural_features(name)
+            structural_features = self._extract_structural_features(forms)
 
-            # Create learning record
-            record = LLMClassificationRecord(
-                name=name,
-                normalized_name=name.lower().strip(),
+            return LLMClassificationRecord(
+                name=forms.name,
+                normalized_name=normalized_name,
                 ethnicity=classification.ethnicity.value,
                 confidence=classification.confidence,
                 llm_provider=classification.llm_details.model_used
@@ -437,29 +1029,34 @@ class NameClassifier:
                 session_id=self.session_id,
             )
 
-            # IMMEDIATE STORAGE: Store directly to database (no queuing)
-            success = self.learning_db.store_llm_classification(record)
-            if success:
-                self.current_session.llm_learning_stores += 1
-                logger.info(
-                    "Immediate LLM classification stored for learning",
-                    extra={
-                        "immediate_name": name,
-                        "immediate_ethnicity": classification.ethnicity.value,
-                        "patterns_extracted": len(linguistic_patterns),
-                        "available_next_lead": True,
-                    },
-                )
-            else:
-                logger.warning(
-                    "Failed to immediately store LLM classification",
-                    extra={"failed_name": name},
-                )
-
         except Exception as e:
+            self._recently_stored.pop(normalized_name, None)
             logger.error(
                 "Failed to immediately store LLM classification for learning",
-                extra={"failed_name": name, "error": str(e)},
+                extra={"failed_name": forms.name, "error": str(e)},
+            )
+            return None
+
+    def _log_learning_store(self, record: LLMClassificationRecord, success: bool):
+        """Count and log the outcome of storing a learning record."""
+
+        if success:
+            self.current_session.llm_learning_stores += 1
+            logger.info(
+                "Immediate LLM classification stored for learning",
+                extra={
+                    "immediate_name": record.name,
+                    "immediate_ethnicity": record.ethnicity,
+                    "patterns_extracted": len(record.linguistic_patterns),
+                    "available_next_lead": True,
+                },
+            )
+        else:
+            # Let a later hit for this name retry the store
+            self._recently_stored.pop(record.normalized_name, None)
+            logger.warning(
+                "Failed to immediately store LLM classification",
+                extra={"failed_name": record.name},
             )
 
     def _queue_llm_classification_for_learning(
@@ -478,47 +1075,15 @@ class NameClassifier:
 
     def _normalize_name_for_phonetics(self, name: str) -> str:
         """Normalize name for phonetic algorithms that require alphabetical characters only."""
-        # Remove common prefixes/suffixes that can interfere
-        normalized = name.strip().lower()
-
-        # Handle South African specific patterns
-        # Remove common prefixes
-        prefixes_to_remove = ["van der ", "van ", "de ", "du ", "le "]
-        for prefix in prefixes_to_remove:
-            if normalized.startswith(prefix):
-                normalized = normalized[len(prefix) :]
-                break
-
-        # Handle apostrophes (common in some SA names)
-        normalized = normalized.replace("'", "")
-
-        # Remove hyphens and spaces for core phonetic matching
-        normalized = normalized.replace("-", "").replace(" ", "")
-
-        # Ensure we have something to work with
-        if not normalized:
-            normalized = name.strip().replace(" ", "")
-
-        return normalized
+        return _normalize_name_for_phonetics(name)
 
     def _extract_phonetic_codes_for_learning(self, name: str) -> Dict[str, str]:
         """Extract phonetic codes using jellyfish algorithms."""
 
         # Normalize name for phonetic algorithms that require alphabetical characters only
-        normalized_name = self._normalize_name_for_phonetics(name)
-
-        try:
-            import jellyfish
+        normalized_name = _normalize_name_for_phonetics(name)
 
-            # Note: jellyfish doesn't have double_metaphone, only metaphone
-            # Using available phonetic algorithms
-            return {
-                "soundex": jellyfish.soundex(normalized_name),
-                "metaphone": jellyfish.metaphone(normalized_name),
-                "nysiis": jellyfish.nysiis(normalized_name),
-                "match_rating_codex": jellyfish.match_rating_codex(normalized_name),
-            }
-        except ImportError:
+        if not JELLYFISH_AVAILABLE:
             logger.warning("Jellyfish not available for phonetic code extraction")
             return {
                 "soundex": "",
@@ -526,6 +1091,17 @@ class NameClassifier:
                 "nysiis": "",
                 "match_rating_codex": "",
             }
+
+        try:
+            soundex, metaphone, nysiis, match_rating_codex = (
+                _phonetic_codes_for_learning(normalized_name)
+            )
+            return {
+                "soundex": soundex,
+                "metaphone": metaphone,
+                "nysiis": nysiis,
+                "match_rating_codex": match_rating_codex,
+            }
         except Exception as e:
             logger.warning(f"Error extracting phonetic codes for '{name}': {e}")
             return {
@@ -535,61 +1111,57 @@ class NameClassifier:
                 "match_rating_codex": "",
             }
 
-    def _detect_sa_linguistic_patterns(self, name: str) -> List[str]:
+    def _detect_sa_linguistic_patterns(
+        self, name: Union[str, _NameForms]
+    ) -> List[str]:
         """Detect South African linguistic patterns."""
+        return list(_sa_linguistic_patterns(_NameForms.of(name).upper))
 
-        patterns = []
-        name_upper = name.upper()
-
-        # Use existing SA knowledge - patterns from successful classifications
-        if name_upper.startswith("HL"):
-            patterns.append("tsonga_hl_prefix")  # HLUNGWANI
-        if "VH" in name_upper:
-            patterns.append("venda_vh_pattern")  # TSHIVHASE
-        if name_upper.startswith("NX"):
-            patterns.append("click_consonant")  # NXANGUMUNI
-        if name_upper.startswith("MUL"):
-            patterns.append("venda_mul_prefix")  # MULAUDZI
-        if name_upper.startswith("MMA"):
-            patterns.append("tswana_mma_prefix")  # MMATSHEPO
-        if name_upper.startswith(("MAB", "MAG", "MAK", "MAM")):
-            patterns.append("sotho_ma_pattern")  # MABENA
-        if name_upper.startswith("MK"):
-            patterns.append("zulu_mk_pattern")  # MKHABELA
-        if "NGU" in name_upper:
-            patterns.append("bantu_ngu_pattern")  # NGUBANE
-
-        return patterns
-
-    def _extract_structural_features(self, name: str) -> Dict[str, any]:
+    def _extract_structural_features(
+        self, name: Union[str, _NameForms]
+    ) -> Dict[str, any]:
         """Extract structural features from name."""
-        import re
-
+        forms = _NameForms.of(name)
+        name = forms.name
+        name_lower = forms.lower
         parts = name.split()
+        # latin-1 keeps one byte per character (others become "?"), so byte
+        # positions line up with the name's characters
+        letter_classes = name.encode("latin-1", "replace").translate(
+            _LETTER_CLASS_TABLE
+        )
 
         features = {
             "word_count": len(parts),
-            "average_word_length": sum(len(part) for part in parts) / len(parts)
+            "average_word_length": sum(map(len, parts)) / len(parts)
             if parts
             else 0,
             "has_hyphen": "-" in name,
-            "starts_with_consonant_cluster": bool(
-                re.match(r"^[BCDFGHJKLMNPQRSTVWXYZ]{2,}", name.upper())
-            ),
-            "vowel_ratio": len(re.findall(r"[AEIOU]", name.upper())) / len(name)
+            "starts_with_consonant_cluster": letter_classes[:2]
+            == bytes((_CONSONANT_CLASS, _CONSONANT_CLASS)),
+            "vowel_ratio": letter_classes.count(_VOWEL_CLASS) / len(name)
             if name
             else 0,
         }
 
         # Prefix/suffix patterns (useful for learning)
         if len(name) >= 3:
-            features["prefix_2"] = name[:2].lower()
-            features["prefix_3"] = name[:3].lower()
-            features["suffix_2"] = name[-2:].lower()
-            features["suffix_3"] = name[-3:].lower()
+            features["prefix_2"] = name_lower[:2]
+            features["prefix_3"] = name_lower[:3]
+            features["suffix_2"] = name_lower[-2:]
+            features["suffix_3"] = name_lower[-3:]
 
         return features
 
+    @property
+    def flush_is_noop(self) -> bool:
+        """Whether flush_pending_learning_records() has nothing to do.
+
+        True in immediate learning mode, so callers such as the job runner can
+        skip the flush call at batch boundaries entirely.
+        """
+        return getattr(self, "_immediate_learning_enabled", False)
+
     def flush_pending_learning_records(self) -> int:
         """Legacy method for backwards compatibility.
 
@@ -598,10 +1170,7 @@ class NameClassifier:
         Maintained for compatibility with existing job runners.
         """
 
-        if (
-            hasattr(self, "_immediate_learning_enabled")
-            and self._immediate_learning_enabled
-        ):
+        if self.flush_is_noop:
             logger.debug(
                 "Flush called but immediate learning is active - no pending records"
             )
@@ -613,6 +1182,13 @@ class NameClassifier:
         )
         return 0
 
+    def close(self) -> None:
+        """Release the learning database's connections at the end of a job.
+
+        The classifier stays usable; later lookups reopen connections lazily.
+        """
+        self.learning_db.close()
+
     def get_session_stats(self) -> ClassificationStats:
         """Get statistics for the current classification session."""
 
@@ -653,8 +1229,13 @@ class NameClassifier:
             else 0.0
         )
 
+        # Session timings are kept in nanoseconds; convert once here
+        total_time_ms = session.total_time_ns / 1_000_000
+        rule_time_ms = session.rule_time_ns / 1_000_000
+        phonetic_time_ms = session.phonetic_time_ns / 1_000_000
+
         avg_time_ms = (
-            session.total_time_ms / session.names_processed
+            total_time_ms / session.names_processed
             if session.names_processed > 0
             else 0.0
         )
@@ -670,16 +1251,16 @@ class NameClassifier:
             phonetic_hit_rate=phonetic_hit_rate,
             llm_usage_rate=llm_usage_rate,
             average_time_ms=avg_time_ms,
-            total_time_ms=session.total_time_ms,
+            total_time_ms=total_time_ms,
             llm_cost_usd=session.llm_cost_usd,
-            error_count=len(session.errors),
+            error_count=session.error_count,
             learned_hits=session.learned_hits,
             learned_hit_rate=learned_hit_rate,
             learning_stores=session.llm_learning_stores,
             performance_targets_met={
-                "rule_time_under_10ms": session.rule_time_ms / max(session.rule_hits, 1)
+                "rule_time_under_10ms": rule_time_ms / max(session.rule_hits, 1)
                 < 10,
-                "phonetic_time_under_50ms": session.phonetic_time_ms
+                "phonetic_time_under_50ms": phonetic_time_ms
                 / max(session.phonetic_hits, 1)
                 < 50,
                 "cache_hit_rate_over_80%": cache_hit_rate > 0.8,
@@ -739,15 +1320,13 @@ class NameClassifier:
             True if LLM was enabled successfully, False otherwise
         """
         try:
-            from dotenv import load_dotenv
-
-            load_dotenv()  # Ensure .env is loaded
+            _load_dotenv_once()  # Ensure .env is loaded
 
             # Initialize LLM classifier if not available
             if self.llm_classifier is None:
                 from .llm import LLMClassifier
 
-                # Get API keys from config
+                # Get API keys from config (get_settings() is cached per process)
                 settings = get_settings()
                 claude_key = settings.get_anthropic_key()
                 openai_key = settings.get_openai_key()
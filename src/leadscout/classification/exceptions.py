@@ -19,12 +19,17 @@ Integration: Inherits from core LeadScout exceptions to maintain consistency
 across the entire application.
 """
 
+import copyreg
 from typing import Any, Dict, List, Optional
 
 
 class ClassificationError(Exception):
     """Base exception for classification system errors."""
 
+    # Subclasses declare slots for their own attributes, so raising them does
+    # not allocate a per-instance __dict__
+    __slots__ = ("name", "method", "details", "__weakref__")
+
     def __init__(
         self,
         message: str,
@@ -37,10 +42,26 @@ class ClassificationError(Exception):
         self.method = method
         self.details = details or {}
 
+    def __reduce__(self):
+        """Pickle slot attributes, which BaseException's reduce omits.
+
+        Unpickling rebuilds the instance with ``cls.__new__`` instead of
+        calling ``__init__``, whose required arguments differ per subclass,
+        and then restores every attribute from the state.
+        """
+        state = dict(getattr(self, "__dict__", None) or {})
+        for cls in type(self).__mro__:
+            for slot in cls.__dict__.get("__slots__", ()):
+                if slot != "__weakref__" and hasattr(self, slot):
+                    state[slot] = getattr(self, slot)
+        return copyreg.__newobj__, (type(self), *self.args), state
+
 
 class NameValidationError(ClassificationError):
     """Exception raised when name validation fails."""
 
+    __slots__ = ("validation_errors", "suggested_corrections")
+
     def __init__(
         self,
         message: str,
@@ -56,6 +77,8 @@ class NameValidationError(ClassificationError):
 class DictionaryError(ClassificationError):
     """Exception raised when dictionary operations fail."""
 
+    __slots__ = ("dictionary_type", "missing_files")
+
     def __init__(
         self,
         message: str,
@@ -70,6 +93,8 @@ class DictionaryError(ClassificationError):
 class RuleClassificationError(ClassificationError):
     """Exception raised during rule-based classification."""
 
+    __slots__ = ("conflicting_matches",)
+
     def __init__(
         self,
         message: str,
@@ -83,6 +108,8 @@ class RuleClassificationError(ClassificationError):
 class PhoneticMatchingError(ClassificationError):
     """Exception raised during phonetic matching."""
 
+    __slots__ = ("failed_algorithms", "partial_results")
+
     def __init__(
         self,
         message: str,
@@ -98,6 +125,8 @@ class PhoneticMatchingError(ClassificationError):
 class LLMClassificationError(ClassificationError):
     """Exception raised during LLM classification."""
 
+    __slots__ = ("model", "api_response", "retry_count")
+
     def __init__(
         self,
         message: str,
@@ -115,6 +144,8 @@ class LLMClassificationError(ClassificationError):
 class LLMRateLimitError(LLMClassificationError):
     """Exception raised when LLM API rate limits are exceeded."""
 
+    __slots__ = ("retry_after_seconds", "daily_limit_exceeded")
+
     def __init__(
         self,
         message: str,
@@ -129,6 +160,8 @@ class LLMRateLimitError(LLMClassificationError):
 class LLMCostLimitError(LLMClassificationError):
     """Exception raised when LLM usage exceeds cost limits."""
 
+    __slots__ = ("current_cost", "cost_limit", "tokens_used")
+
     def __init__(
         self,
         message: str,
@@ -145,6 +178,8 @@ class LLMCostLimitError(LLMClassificationError):
 class CacheIntegrationError(ClassificationError):
     """Exception raised when cache integration fails."""
 
+    __slots__ = ("cache_operation", "cache_details")
+
     def __init__(
         self,
         message: str,
@@ -160,6 +195,8 @@ class CacheIntegrationError(ClassificationError):
 class BatchProcessingError(ClassificationError):
     """Exception raised during batch processing operations."""
 
+    __slots__ = ("batch_size", "processed_count", "failed_names", "partial_results")
+
     def __init__(
         self,
         message: str,
@@ -178,6 +215,8 @@ class BatchProcessingError(ClassificationError):
 class ConfidenceThresholdError(ClassificationError):
     """Exception raised when classification confidence is below required threshold."""
 
+    __slots__ = ("achieved_confidence", "required_confidence")
+
     def __init__(
         self,
         message: str,
@@ -194,6 +233,8 @@ class ConfidenceThresholdError(ClassificationError):
 class AugmentedRetrievalError(ClassificationError):
     """Exception raised when augmented retrieval for few-shot learning fails."""
 
+    __slots__ = ("search_method", "examples_found", "minimum_required")
+
     def __init__(
         self,
         message: str,
@@ -211,6 +252,8 @@ class AugmentedRetrievalError(ClassificationError):
 class MultiWordAnalysisError(ClassificationError):
     """Exception raised during multi-word name analysis."""
 
+    __slots__ = ("name_parts", "individual_errors")
+
     def __init__(
         self,
         message: str,
@@ -226,6 +269,8 @@ class MultiWordAnalysisError(ClassificationError):
 class EthnicityMappingError(ClassificationError):
     """Exception raised when ethnicity mapping or conversion fails."""
 
+    __slots__ = ("source_ethnicity", "target_system", "available_mappings")
+
     def __init__(
         self,
         message: str,
@@ -242,6 +287,8 @@ class EthnicityMappingError(ClassificationError):
 class ConfigurationError(ClassificationError):
     """Exception raised when classification system configuration is invalid."""
 
+    __slots__ = ("config_section", "invalid_values")
+
     def __init__(
         self,
         message: str,
@@ -256,6 +303,8 @@ class ConfigurationError(ClassificationError):
 class PerformanceError(ClassificationError):
     """Exception raised when performance targets are not met."""
 
+    __slots__ = ("operation", "actual_time_ms", "target_time_ms", "performance_impact")
+
     def __init__(
         self,
         message: str,
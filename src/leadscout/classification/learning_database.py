@@ -5,10 +5,13 @@ This SQLite database stores every LLM classification to build a self-improving
 classification system that reduces LLM dependency over time.
 """
 
+import copy
 import json
+import re
 import sqlite3
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -20,6 +23,24 @@ from .models import Classification, ClassificationMethod, EthnicityType
 
 logger = structlog.get_logger(__name__)
 
+# Learned linguistic markers that lookups know how to apply, as regexes over
+# the upper-cased name. Other stored markers never match.
+LINGUISTIC_MARKER_PATTERNS: Dict[str, str] = {
+    "tsonga_hl_prefix": "^HL",
+    "venda_vh_pattern": "VH",
+    "click_consonant": "^NX",
+    "tswana_mma_prefix": "^MMA",
+}
+
+# One alternation with a named group per marker, so a single finditer() scan
+# reports every marker in a name
+_LINGUISTIC_MARKER_RE = re.compile(
+    "|".join(
+        f"(?P<{marker}>{regex})"
+        for marker, regex in LINGUISTIC_MARKER_PATTERNS.items()
+    )
+)
+
 
 @dataclass
 class LLMClassificationRecord:
@@ -58,27 +79,185 @@ class LearnedPattern:
 class LLMLearningDatabase:
     """Persistent SQLite database for LLM classification learning."""
 
-    # Class-level lock to prevent concurrent database access
-    _db_lock = threading.RLock()
+    # Class-level lock serializing writes. WAL lets readers run alongside a
+    # writer, so lookups and statistics do not take it.
+    _write_lock = threading.Lock()
+
+    # Names per IN (...) query, kept below SQLite's default variable limit
+    BULK_LOOKUP_CHUNK_SIZE = 500
+
+    # Records per multi-row llm_classifications INSERT; at 12 parameters each
+    # this also stays below the variable limit
+    STORE_BATCH_CHUNK_SIZE = 80
+
+    # Seconds a statistics snapshot may be reused. Writes through this instance
+    # invalidate it immediately; the TTL bounds staleness from other writers.
+    STATISTICS_CACHE_TTL_SECONDS = 60.0
+
+    # Normalized names kept in the in-process learned lookup cache
+    LOOKUP_CACHE_MAX_SIZE = 4096
+
+    # Seconds a memoized lookup, hit or miss, may be reused. As with the
+    # statistics, the TTL bounds staleness from other writers to the file.
+    LOOKUP_CACHE_TTL_SECONDS = 60.0
+
+    # Direct cache hits served from memory before their access_count updates
+    # are written out in one batch
+    ACCESS_COUNT_FLUSH_HITS = 100
+
+    # Evidence count at which a learned prefix keeps its full confidence
+    PREFIX_MATCH_FULL_EVIDENCE = 3
+
+    # Stored classifications between PRAGMA optimize runs, which refresh the
+    # query planner's statistics as the learned tables grow
+    OPTIMIZE_AFTER_WRITES = 1000
 
-    def __init__(self, db_path: Path = None):
+    def __init__(self, db_path: Path = None, min_store_confidence: float = 0.6):
+        """Open or create the learning database.
+
+        Args:
+            db_path: SQLite file, ``cache/llm_learning.db`` by default
+            min_store_confidence: LLM results below this confidence are not
+                stored at all
+        """
         if db_path is None:
             db_path = Path("cache") / "llm_learning.db"
 
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.min_store_confidence = min_store_confidence
+
+        # One connection per thread, opened on first use and kept, so calls
+        # skip connection setup and keep SQLite's page cache warm. All of
+        # them are tracked with their thread so close() can release them and
+        # connections of threads that have exited are closed early.
+        self._local = threading.local()
+        self._connections: List[Tuple[threading.Thread, sqlite3.Connection]] = []
+        self._connections_lock = threading.Lock()
+        self._writes_since_optimize = 0
+
         self._initialize_database()
 
+        # Guards the in-memory caches below, which reader threads share. Each
+        # write bumps _generation after it commits, and a reader only stores
+        # what it derived if no write happened since it started.
+        self._cache_lock = threading.Lock()
+        self._generation = 0
+
+        # Memoized get_learning_statistics() result and its monotonic timestamp
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cached_at = 0.0
+
+        # LRU of find_learned_classification results keyed by normalized name,
+        # including misses, with the monotonic time each was stored. Any write
+        # can create patterns that change other names' results, so writes
+        # through this instance clear it entirely.
+        self._lookup_cache: (
+            "OrderedDict[str, Tuple[Optional[Classification], float]]"
+        ) = OrderedDict()
+        self._lookup_cache_max = self.LOOKUP_CACHE_MAX_SIZE
+
+        # Direct cache hits served from _lookup_cache per normalized name,
+        # not yet added to classification_cache.access_count
+        self._pending_access_counts: Dict[str, int] = {}
+        self._pending_access_total = 0
+
+        # Character trie of learned structural prefixes, built lazily from
+        # learned_patterns and dropped on write or after
+        # LOOKUP_CACHE_TTL_SECONDS so the next lookup rebuilds it
+        self._prefix_trie: Optional[Dict[Optional[str], Any]] = None
+        self._prefix_trie_built_at = 0.0
+
+        # Active learned linguistic markers as (marker, ethnicity, confidence
+        # with evidence boost), cached and dropped like the trie
+        self._linguistic_markers: Optional[List[Tuple[str, str, float]]] = None
+        self._linguistic_markers_loaded_at = 0.0
+
         logger.info("LLM Learning Database initialized", db_path=str(self.db_path))
 
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's database connection, opening it if needed.
+
+        Use it as ``with self._connection() as conn:`` so each block commits
+        on success and rolls back on error, as a fresh connection did.
+        """
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # close() may run on another thread than the one that opened it.
+            # IMMEDIATE takes the write lock when a write transaction starts,
+            # so a record's ingest never has to upgrade a read lock mid-way.
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=30.0,
+                check_same_thread=False,
+                isolation_level="IMMEDIATE",
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-65536")  # Up to 64 MiB
+            conn.execute("PRAGMA mmap_size=268435456")  # Up to 256 MiB
+            self._local.conn = conn
+            with self._connections_lock:
+                finished = [
+                    (thread, other)
+                    for thread, other in self._connections
+                    if not thread.is_alive()
+                ]
+                self._connections = [
+                    (thread, other)
+                    for thread, other in self._connections
+                    if thread.is_alive()
+                ]
+                self._connections.append((threading.current_thread(), conn))
+            for _, other in finished:
+                other.close()
+        return conn
+
+    def close(self) -> None:
+        """Close every connection opened by this instance."""
+
+        self._flush_access_counts()
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for _, conn in connections:
+            self._optimize(conn)
+            conn.close()
+        self._local = threading.local()
+
+    def _optimize(self, conn: sqlite3.Connection) -> None:
+        """Run PRAGMA optimize, which only analyzes tables that need it."""
+
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.warning("PRAGMA optimize failed", extra={"error": str(e)})
+
     def _initialize_database(self):
         """Create database tables for LLM learning."""
 
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
+        with self._connection() as conn:
             # Enable WAL mode for better concurrency
             conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA synchronous=NORMAL")
-            conn.execute("PRAGMA temp_store=MEMORY")
+
+            # classification_cache used to be keyed by a SHA-256 of the
+            # normalized name; move it aside so the script recreates it
+            cache_columns = {
+                row[1]
+                for row in conn.execute("PRAGMA table_info(classification_cache)")
+            }
+            if "name_hash" in cache_columns:
+                conn.execute(
+                    "ALTER TABLE classification_cache "
+                    "RENAME TO classification_cache_sha256"
+                )
+
+            # Family members used to be kept as a JSON list on each family
+            has_member_table = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                ("phonetic_family_members",),
+            ).fetchone()
+
             conn.executescript(
                 """
                 -- Core LLM classifications storage
@@ -118,6 +297,13 @@ class LLMLearningDatabase:
                     UNIQUE(pattern_type, pattern_value, target_ethnicity)
                 );
                 
+                -- Partial covering index for linguistic marker lookups; the
+                -- filtered columns lead so the planner picks it without stats
+                CREATE INDEX IF NOT EXISTS idx_patterns_ling ON learned_patterns(
+                    pattern_type, is_active, confidence_score DESC,
+                    pattern_value, target_ethnicity, evidence_count
+                ) WHERE pattern_type = 'linguistic_marker' AND is_active = true;
+                
                 -- Pattern application tracking (for measuring success)
                 CREATE TABLE IF NOT EXISTS pattern_applications (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -142,18 +328,26 @@ class LLMLearningDatabase:
                     ethnicity TEXT,
                     confidence REAL,
                     member_count INTEGER DEFAULT 1,
-                    representative_names JSON,  -- Sample names in this family
+                    representative_names JSON,  -- Legacy; see phonetic_family_members
                     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 );
                 
+                -- Names seen in each phonetic family, in the order they joined;
+                -- the last 10 by rowid are the family's representatives
+                CREATE TABLE IF NOT EXISTS phonetic_family_members (
+                    family_id INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    
+                    UNIQUE(family_id, name)
+                );
+                
                 -- Indexes for fast phonetic lookups
-                CREATE INDEX IF NOT EXISTS idx_soundex ON phonetic_families(soundex_code, ethnicity);
                 CREATE INDEX IF NOT EXISTS idx_metaphone ON phonetic_families(metaphone_code, ethnicity);
                 CREATE INDEX IF NOT EXISTS idx_dmetaphone ON phonetic_families(double_metaphone_primary, ethnicity);
                 
                 -- Fast lookup cache for classification results
                 CREATE TABLE IF NOT EXISTS classification_cache (
-                    name_hash TEXT PRIMARY KEY,  -- SHA256 of normalized name
+                    normalized_name TEXT PRIMARY KEY,  -- name.lower().strip()
                     original_name TEXT,
                     best_ethnicity TEXT,
                     confidence REAL,
@@ -162,7 +356,7 @@ class LLMLearningDatabase:
                     cache_ttl_hours INTEGER DEFAULT 8760,  -- 1 year default TTL
                     access_count INTEGER DEFAULT 0,
                     last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
+                ) WITHOUT ROWID;
                 
                 -- Linguistic pattern recognition rules
                 CREATE TABLE IF NOT EXISTS linguistic_rules (
@@ -192,12 +386,113 @@ class LLMLearningDatabase:
             """
             )
 
+            # One family per (soundex_code, ethnicity) so writes can upsert.
+            # Older databases may hold duplicates; keep the first of each,
+            # the only one the previous lookup-then-update code maintained.
+            if not conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?",
+                ("idx_soundex_family",),
+            ).fetchone():
+                conn.execute(
+                    """
+                    DELETE FROM phonetic_families
+                    WHERE id NOT IN (
+                        SELECT MIN(id) FROM phonetic_families
+                        GROUP BY soundex_code, ethnicity
+                    )
+                """
+                )
+                conn.execute(
+                    """
+                    CREATE UNIQUE INDEX idx_soundex_family
+                    ON phonetic_families(soundex_code, ethnicity)
+                """
+                )
+                conn.execute("DROP INDEX IF EXISTS idx_soundex")
+
+            if conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                ("classification_cache_sha256",),
+            ).fetchone():
+                self._migrate_hashed_classification_cache(conn)
+
+            if not has_member_table:
+                self._migrate_representative_names(conn)
+
+    def _migrate_representative_names(self, conn: sqlite3.Connection):
+        """Move the JSON representative_names lists into phonetic_family_members."""
+
+        families = conn.execute(
+            """
+            SELECT id, representative_names FROM phonetic_families
+            WHERE representative_names IS NOT NULL
+        """
+        ).fetchall()
+
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO phonetic_family_members (family_id, name)
+            VALUES (?, ?)
+        """,
+            [
+                (family_id, name)
+                for family_id, names_json in families
+                for name in json.loads(names_json)
+            ],
+        )
+        conn.execute("UPDATE phonetic_families SET representative_names = NULL")
+
+    def _migrate_hashed_classification_cache(self, conn: sqlite3.Connection):
+        """Copy SHA-256 keyed cache rows into classification_cache and drop them.
+
+        Keys are rebuilt from original_name the same way records normalize
+        names; the hash itself cannot be reversed.
+        """
+
+        rows = conn.execute(
+            """
+            SELECT original_name, best_ethnicity, confidence, classification_method,
+                   cached_timestamp, cache_ttl_hours, access_count, last_accessed
+            FROM classification_cache_sha256
+            WHERE original_name IS NOT NULL
+        """
+        ).fetchall()
+
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO classification_cache
+            (normalized_name, original_name, best_ethnicity, confidence,
+             classification_method, cached_timestamp, cache_ttl_hours,
+             access_count, last_accessed)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            [(row[0].lower().strip(),) + tuple(row) for row in rows],
+        )
+        conn.execute("DROP TABLE classification_cache_sha256")
+
+        logger.info(
+            "Classification cache re-keyed by normalized name",
+            extra={"migrated_rows": len(rows)},
+        )
+
     def store_llm_classification(self, record: LLMClassificationRecord) -> bool:
-        """Store an LLM classification for learning."""
+        """Store an LLM classification for learning.
 
-        with self._db_lock:
+        Returns:
+            True if stored; False if the write failed or the record is below
+            ``min_store_confidence``
+        """
+
+        if record.confidence < self.min_store_confidence:
+            logger.debug(
+                "Skipping low-confidence LLM classification",
+                extra={"skipped_name": record.name, "confidence": record.confidence},
+            )
+            return False
+
+        with self._write_lock:
             try:
-                with sqlite3.connect(self.db_path, timeout=30.0) as conn:
+                with self._connection() as conn:
                     conn.execute(
                         """
                         INSERT OR REPLACE INTO llm_classifications 
@@ -206,20 +501,7 @@ class LLMLearningDatabase:
                          structural_features, classification_timestamp, session_id)
                         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """,
-                        (
-                            record.name,
-                            record.normalized_name,
-                            record.ethnicity,
-                            record.confidence,
-                            record.llm_provider,
-                            record.processing_time_ms,
-                            record.cost_usd,
-                            json.dumps(record.phonetic_codes),
-                            json.dumps(record.linguistic_patterns),
-                            json.dumps(record.structural_features),
-                            record.classification_timestamp.isoformat(),
-                            record.session_id,
-                        ),
+                        self._classification_row(record),
                     )
 
                     # Immediately extract patterns for learning
@@ -243,6 +525,111 @@ class LLMLearningDatabase:
                 )
                 return False
 
+            finally:
+                self._after_write(1)
+
+    def store_llm_classifications(self, records: List[LLMClassificationRecord]) -> int:
+        """Store many LLM classifications for learning in one transaction.
+
+        The result is the same as calling store_llm_classification() for each
+        record in order, but the llm_classifications rows are written with
+        multi-row INSERTs and everything commits together.
+
+        Returns:
+            Number of records stored; 0 if the batch failed and was rolled back.
+            Records below ``min_store_confidence`` are skipped and not counted.
+        """
+
+        records = [
+            record
+            for record in records
+            if record.confidence >= self.min_store_confidence
+        ]
+        if not records:
+            return 0
+
+        with self._write_lock:
+            try:
+                with self._connection() as conn:
+                    for offset in range(0, len(records), self.STORE_BATCH_CHUNK_SIZE):
+                        chunk = records[offset : offset + self.STORE_BATCH_CHUNK_SIZE]
+                        values = ", ".join(
+                            ["(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"] * len(chunk)
+                        )
+                        conn.execute(
+                            f"""
+                            INSERT OR REPLACE INTO llm_classifications 
+                            (name, normalized_name, ethnicity, confidence, llm_provider, 
+                             processing_time_ms, cost_usd, phonetic_codes, linguistic_patterns, 
+                             structural_features, classification_timestamp, session_id)
+                            VALUES {values}
+                        """,
+                            [
+                                value
+                                for record in chunk
+                                for value in self._classification_row(record)
+                            ],
+                        )
+
+                    # Patterns accumulate evidence, so apply them in record order
+                    for record in records:
+                        self._extract_and_store_patterns(conn, record)
+
+                logger.info(
+                    "LLM classifications stored and learned",
+                    extra={"stored_count": len(records)},
+                )
+                return len(records)
+
+            except Exception as e:
+                logger.error(
+                    "Failed to store LLM classifications",
+                    extra={"record_count": len(records), "error": str(e)},
+                )
+                return 0
+
+            finally:
+                self._after_write(len(records))
+
+    @staticmethod
+    def _classification_row(record: LLMClassificationRecord) -> Tuple[Any, ...]:
+        """Build the llm_classifications parameters for a record."""
+
+        return (
+            record.name,
+            record.normalized_name,
+            record.ethnicity,
+            record.confidence,
+            record.llm_provider,
+            record.processing_time_ms,
+            record.cost_usd,
+            json.dumps(record.phonetic_codes),
+            json.dumps(record.linguistic_patterns),
+            json.dumps(record.structural_features),
+            record.classification_timestamp.isoformat(),
+            record.session_id,
+        )
+
+    def _after_write(self, record_count: int) -> None:
+        """Invalidate caches after a store and run PRAGMA optimize when due."""
+
+        self._invalidate_caches()
+
+        self._writes_since_optimize += record_count
+        if self._writes_since_optimize >= self.OPTIMIZE_AFTER_WRITES:
+            self._writes_since_optimize = 0
+            self._optimize(self._connection())
+
+    def _invalidate_caches(self) -> None:
+        """Drop every in-memory result derived from the database."""
+
+        with self._cache_lock:
+            self._generation += 1
+            self._stats_cache = None
+            self._lookup_cache.clear()
+            self._prefix_trie = None
+            self._linguistic_markers = None
+
     def _extract_and_store_patterns(
         self, conn: sqlite3.Connection, record: LLMClassificationRecord
     ):
@@ -255,58 +642,64 @@ class LLMLearningDatabase:
         # 1. Store phonetic family information
         self._store_phonetic_family(conn, record)
 
-        # 2. Extract and store structural patterns
-        self._store_structural_patterns(conn, record)
-
-        # 3. Extract and store linguistic patterns
-        self._store_linguistic_patterns(conn, record)
+        # 2. Store structural and linguistic patterns in one batch
+        conn.executemany(
+            """
+            INSERT INTO learned_patterns
+            (pattern_id, pattern_type, pattern_value, target_ethnicity,
+             confidence_score, evidence_count)
+            VALUES (?, ?, ?, ?, ?, 2)
+            ON CONFLICT(pattern_id) DO UPDATE
+            SET evidence_count = evidence_count + 1,
+                confidence_score = (confidence_score * evidence_count + excluded.confidence_score) / (evidence_count + 1),
+                last_validated = CURRENT_TIMESTAMP
+        """,
+            self._structural_pattern_rows(record)
+            + self._linguistic_pattern_rows(record),
+        )
 
-        # 4. Update classification cache
+        # 3. Update classification cache
         self._update_classification_cache(conn, record)
 
-    def _store_structural_patterns(
-        self, conn: sqlite3.Connection, record: LLMClassificationRecord
-    ):
-        """Store structural patterns for learning."""
+    def _structural_pattern_rows(
+        self, record: LLMClassificationRecord
+    ) -> List[Tuple[str, str, str, str, float]]:
+        """Build learned_patterns rows for the record's structural prefixes."""
 
         features = record.structural_features
+        rows = []
 
-        # Store prefix patterns
         for prefix_key in ["prefix_2", "prefix_3"]:
             if prefix_key in features:
                 prefix_value = features[prefix_key]
                 if len(prefix_value) >= 2:
-                    pattern_id = (
-                        f"structural_{prefix_key}_{prefix_value}_{record.ethnicity}"
-                    )
-
-                    conn.execute(
-                        """
-                        INSERT OR IGNORE INTO learned_patterns 
-                        (pattern_id, pattern_type, pattern_value, target_ethnicity, 
-                         confidence_score, evidence_count)
-                        VALUES (?, ?, ?, ?, ?, 1)
-                    """,
+                    rows.append(
                         (
-                            pattern_id,
+                            f"structural_{prefix_key}_{prefix_value}_{record.ethnicity}",
                             f"structural_{prefix_key}",
                             prefix_value,
                             record.ethnicity,
                             record.confidence,
-                        ),
+                        )
                     )
 
-                    # Update evidence count if pattern already exists
-                    conn.execute(
-                        """
-                        UPDATE learned_patterns 
-                        SET evidence_count = evidence_count + 1,
-                            confidence_score = (confidence_score * evidence_count + ?) / (evidence_count + 1),
-                            last_validated = CURRENT_TIMESTAMP
-                        WHERE pattern_id = ?
-                    """,
-                        (record.confidence, pattern_id),
-                    )
+        return rows
+
+    def _linguistic_pattern_rows(
+        self, record: LLMClassificationRecord
+    ) -> List[Tuple[str, str, str, str, float]]:
+        """Build learned_patterns rows for the record's linguistic markers."""
+
+        return [
+            (
+                f"linguistic_{pattern}_{record.ethnicity}",
+                "linguistic_marker",
+                pattern,
+                record.ethnicity,
+                record.confidence,
+            )
+            for pattern in record.linguistic_patterns
+        ]
 
     def _store_phonetic_family(
         self, conn: sqlite3.Connection, record: LLMClassificationRecord
@@ -315,173 +708,365 @@ class LLMLearningDatabase:
 
         phonetic_codes = record.phonetic_codes
 
-        # Update or create phonetic family entries
-        for code_type, code_value in phonetic_codes.items():
-            if not code_value or len(code_value) < 2:
-                continue
+        # Every usable code used to apply one update to the record's soundex
+        # family, so it counts as that many members
+        code_count = sum(
+            1
+            for code_value in phonetic_codes.values()
+            if code_value and len(code_value) >= 2
+        )
+        if not code_count:
+            return
 
-            # Check if family exists
-            existing = conn.execute(
-                """
-                SELECT id, member_count, representative_names, confidence 
-                FROM phonetic_families 
-                WHERE soundex_code = ? AND ethnicity = ?
-            """,
-                (phonetic_codes.get("soundex", ""), record.ethnicity),
-            ).fetchone()
+        (family_id,) = conn.execute(
+            """
+            INSERT INTO phonetic_families
+            (soundex_code, metaphone_code, double_metaphone_primary,
+             double_metaphone_secondary, ethnicity, confidence, member_count)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(soundex_code, ethnicity) DO UPDATE
+            SET member_count = member_count + excluded.member_count,
+                confidence = (confidence * member_count + excluded.confidence * excluded.member_count)
+                    / (member_count + excluded.member_count),
+                last_updated = CURRENT_TIMESTAMP
+            RETURNING id
+        """,
+            (
+                phonetic_codes.get("soundex", ""),
+                phonetic_codes.get("metaphone", ""),
+                phonetic_codes.get(
+                    "nysiis", ""
+                ),  # Use nysiis instead of double_metaphone_primary
+                phonetic_codes.get(
+                    "match_rating_codex", ""
+                ),  # Use match_rating instead of double_metaphone_secondary
+                record.ethnicity,
+                record.confidence,
+                code_count,
+            ),
+        ).fetchall()[0]
+
+        # A name already in the family keeps its original position
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO phonetic_family_members (family_id, name)
+            VALUES (?, ?)
+        """,
+            (family_id, record.name),
+        )
 
-            if existing:
-                # Update existing family
-                family_id, member_count, names_json, old_confidence = existing
-                names = json.loads(names_json) if names_json else []
+    def find_learned_classification(
+        self,
+        name: str,
+        normalized_name: Optional[str] = None,
+        record_access: bool = True,
+    ) -> Optional[Classification]:
+        """Find classification using learned patterns.
+
+        Args:
+            name: Name to look up
+            normalized_name: ``name.lower().strip()`` if the caller already has
+                it, so the cache key is not recomputed
+            record_access: Count a direct cache hit in its access_count. Callers
+                that may discard the result pass False and call
+                record_cache_access() once they use it.
+        """
 
-                if record.name not in names:
-                    names.append(record.name)
-                    names = names[-10:]  # Keep last 10 representative names
+        start_time = time.time()
 
-                # Update confidence with weighted average
-                new_confidence = (old_confidence * member_count + record.confidence) / (
-                    member_count + 1
-                )
+        if normalized_name is None:
+            normalized_name = name.lower().strip()
+
+        with self._cache_lock:
+            entry = self._lookup_cache.get(normalized_name)
+            if (
+                entry is not None
+                and time.monotonic() - entry[1] >= self.LOOKUP_CACHE_TTL_SECONDS
+            ):
+                # Another instance may have learned this name since
+                del self._lookup_cache[normalized_name]
+                entry = None
+
+            if entry is not None:
+                self._lookup_cache.move_to_end(normalized_name)
+                cached = entry[0]
+                if cached is not None:
+                    if record_access and cached.method == ClassificationMethod.CACHE:
+                        # Counted as the database lookup would have, in batches
+                        self._count_access(normalized_name)
+                    cached = cached.model_copy(update={"name": name})
+            else:
+                generation = self._generation
 
-                conn.execute(
-                    """
-                    UPDATE phonetic_families 
-                    SET member_count = member_count + 1,
-                        representative_names = ?,
-                        confidence = ?,
-                        last_updated = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """,
-                    (json.dumps(names), new_confidence, family_id),
-                )
+        if self._pending_access_total >= self.ACCESS_COUNT_FLUSH_HITS:
+            self._flush_access_counts()
 
-            else:
-                # Create new phonetic family
-                conn.execute(
-                    """
-                    INSERT INTO phonetic_families 
-                    (soundex_code, metaphone_code, double_metaphone_primary, 
-                     double_metaphone_secondary, ethnicity, confidence, 
-                     representative_names)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        phonetic_codes.get("soundex", ""),
-                        phonetic_codes.get("metaphone", ""),
-                        phonetic_codes.get(
-                            "nysiis", ""
-                        ),  # Use nysiis instead of double_metaphone_primary
-                        phonetic_codes.get(
-                            "match_rating_codex", ""
-                        ),  # Use match_rating instead of double_metaphone_secondary
-                        record.ethnicity,
-                        record.confidence,
-                        json.dumps([record.name]),
-                    ),
+        if entry is not None:
+            return cached
+
+        phonetic_codes = self._phonetic_lookup_codes(name)
+
+        try:
+            with self._connection() as conn:
+                # 1. Check direct cache hit, then 2. phonetic family
+                # matches, 3. linguistic pattern matches and 4. learned
+                # structural prefixes
+                result = (
+                    self._check_classification_cache(
+                        conn, name, normalized_name, record_access
+                    )
+                    or self._find_phonetic_family_match(conn, name, phonetic_codes)
+                    or self._find_linguistic_pattern_match(conn, name)
+                    or self._find_prefix_pattern_match(conn, name)
                 )
 
-    def _store_linguistic_patterns(
-        self, conn: sqlite3.Connection, record: LLMClassificationRecord
-    ):
-        """Store linguistic patterns for pattern matching."""
+            with self._cache_lock:
+                if self._generation == generation:
+                    self._lookup_cache[normalized_name] = (result, time.monotonic())
+                    if len(self._lookup_cache) > self._lookup_cache_max:
+                        self._lookup_cache.popitem(last=False)
 
-        for pattern in record.linguistic_patterns:
-            pattern_id = f"linguistic_{pattern}_{record.ethnicity}"
+            return result
 
-            conn.execute(
-                """
-                INSERT OR IGNORE INTO learned_patterns 
-                (pattern_id, pattern_type, pattern_value, target_ethnicity, 
-                 confidence_score, evidence_count)
-                VALUES (?, 'linguistic_marker', ?, ?, ?, 1)
-            """,
-                (pattern_id, pattern, record.ethnicity, record.confidence),
+        except Exception as e:
+            logger.error(
+                "Error in learned classification lookup",
+                extra={"lookup_name": name, "error": str(e)},
             )
+            return None
 
-            # Update evidence count if pattern already exists
-            conn.execute(
-                """
-                UPDATE learned_patterns 
-                SET evidence_count = evidence_count + 1,
-                    confidence_score = (confidence_score * evidence_count + ?) / (evidence_count + 1),
-                    last_validated = CURRENT_TIMESTAMP
-                WHERE pattern_id = ?
-            """,
-                (record.confidence, pattern_id),
+        finally:
+            processing_time = (time.time() - start_time) * 1000
+            logger.debug(
+                "Learned classification lookup completed",
+                extra={"lookup_name": name, "processing_time_ms": processing_time},
             )
 
-    def find_learned_classification(self, name: str) -> Optional[Classification]:
-        """Find classification using learned patterns."""
+    def record_cache_access(self, normalized_name: str) -> None:
+        """Count a direct cache hit found with ``record_access=False``.
 
-        start_time = time.time()
+        Only counted in memory; it is written with the next batch of
+        memoized hits, on close() or before cleanup.
+        """
 
-        with self._db_lock:
-            try:
-                with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-                    # 1. Check direct cache hit
-                    cache_result = self._check_classification_cache(conn, name)
-                    if cache_result:
-                        return cache_result
+        with self._cache_lock:
+            self._count_access(normalized_name)
 
-                    # 2. Check phonetic family matches
-                    phonetic_result = self._find_phonetic_family_match(conn, name)
-                    if phonetic_result:
-                        return phonetic_result
+    def _count_access(self, normalized_name: str) -> None:
+        """Add a pending access_count increment. Hold _cache_lock."""
 
-                    # 3. Check linguistic pattern matches
-                    linguistic_result = self._find_linguistic_pattern_match(conn, name)
-                    if linguistic_result:
-                        return linguistic_result
+        self._pending_access_counts[normalized_name] = (
+            self._pending_access_counts.get(normalized_name, 0) + 1
+        )
+        self._pending_access_total += 1
 
-                    return None
+    def _flush_access_counts(self) -> None:
+        """Write access counts for direct cache hits served from memory."""
 
-            except Exception as e:
-                logger.error(
-                    "Error in learned classification lookup",
-                    extra={"lookup_name": name, "error": str(e)},
-                )
-                return None
+        with self._cache_lock:
+            pending = self._pending_access_counts
+            if not pending:
+                return
+            self._pending_access_counts = {}
+            self._pending_access_total = 0
 
-            finally:
-                processing_time = (time.time() - start_time) * 1000
-                logger.debug(
-                    "Learned classification lookup completed",
-                    extra={"lookup_name": name, "processing_time_ms": processing_time},
+        try:
+            with self._write_lock, self._connection() as conn:
+                conn.executemany(
+                    """
+                    UPDATE classification_cache
+                    SET access_count = access_count + ?,
+                        last_accessed = CURRENT_TIMESTAMP
+                    WHERE normalized_name = ?
+                """,
+                    [(count, key) for key, count in pending.items()],
                 )
+        except sqlite3.Error as e:
+            logger.warning(
+                "Failed to update cache access counts",
+                extra={"name_count": len(pending), "error": str(e)},
+            )
+
+    def find_learned_classifications_bulk(
+        self, names: List[str]
+    ) -> Dict[str, Classification]:
+        """Find learned classifications for many names in one database session.
+
+        Direct cache hits and then phonetic family matches are each resolved
+        with one ``IN (...)`` query per chunk of names; the remaining names
+        fall through to the in-memory linguistic and prefix lookups.
+
+        Returns:
+            Mapping of input name to classification. Names without a learned
+            classification are omitted.
+        """
+
+        results: Dict[str, Classification] = {}
+        if not names:
+            return results
+
+        start_time = time.time()
+
+        # Several input spellings can share one cache entry
+        names_by_key: Dict[str, List[str]] = {}
+        for name in dict.fromkeys(names):
+            names_by_key.setdefault(name.lower().strip(), []).append(name)
+
+        codes_by_name = {
+            name: self._phonetic_lookup_codes(name)
+            for hit_names in names_by_key.values()
+            for name in hit_names
+        }
+
+        try:
+            with self._connection() as conn:
+                # 1. Direct cache hits in chunks below SQLite's variable limit
+                keys = list(names_by_key)
+                hit_counts: List[Tuple[int, str]] = []
+                for offset in range(0, len(keys), self.BULK_LOOKUP_CHUNK_SIZE):
+                    chunk = keys[offset : offset + self.BULK_LOOKUP_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"""
+                        SELECT normalized_name, best_ethnicity, confidence
+                        FROM classification_cache
+                        WHERE normalized_name IN ({placeholders})
+                            AND cached_timestamp > datetime('now', '-' || cache_ttl_hours || ' hours')
+                    """,
+                        chunk,
+                    ).fetchall()
+
+                    for key, ethnicity, confidence in rows:
+                        hit_names = names_by_key[key]
+                        hit_counts.append((len(hit_names), key))
+                        for name in hit_names:
+                            results[name] = Classification(
+                                name=name,
+                                ethnicity=EthnicityType(ethnicity),
+                                confidence=confidence,
+                                method=ClassificationMethod.CACHE,
+                                processing_time_ms=0.1,
+                            )
+
+                if hit_counts:
+                    with self._write_lock, conn:
+                        conn.executemany(
+                            """
+                            UPDATE classification_cache
+                            SET access_count = access_count + ?,
+                                last_accessed = CURRENT_TIMESTAMP
+                            WHERE normalized_name = ?
+                        """,
+                            hit_counts,
+                        )
+
+                # 2. Phonetic families for the remaining names, two
+                # parameters per name per query
+                misses = [
+                    name
+                    for name, codes in codes_by_name.items()
+                    if codes is not None and name not in results
+                ]
+                chunk_size = self.BULK_LOOKUP_CHUNK_SIZE // 2
+                for offset in range(0, len(misses), chunk_size):
+                    chunk = misses[offset : offset + chunk_size]
+                    families = self._fetch_phonetic_families(
+                        conn,
+                        [codes_by_name[name][0] for name in chunk],
+                        [codes_by_name[name][1] for name in chunk],
+                    )
+                    # Position of the best family for each code
+                    best_by_soundex: Dict[str, int] = {}
+                    best_by_metaphone: Dict[str, int] = {}
+                    for position, family in enumerate(families):
+                        best_by_soundex.setdefault(family[0], position)
+                        best_by_metaphone.setdefault(family[1], position)
+
+                    for name in chunk:
+                        soundex_code, metaphone_code = codes_by_name[name]
+                        positions = [
+                            position
+                            for position in (
+                                best_by_soundex.get(soundex_code),
+                                best_by_metaphone.get(metaphone_code),
+                            )
+                            if position is not None
+                        ]
+                        if positions:
+                            result = self._phonetic_family_classification(
+                                name, families[min(positions)][2:]
+                            )
+                            if result:
+                                results[name] = result
+
+                # 3.-4. Linguistic and prefix fallbacks
+                for hit_names in names_by_key.values():
+                    for name in hit_names:
+                        if name in results:
+                            continue
+                        result = (
+                            self._find_linguistic_pattern_match(conn, name)
+                            or self._find_prefix_pattern_match(conn, name)
+                        )
+                        if result:
+                            results[name] = result
+
+        except Exception as e:
+            logger.error(
+                "Error in bulk learned classification lookup",
+                extra={"lookup_count": len(names), "error": str(e)},
+            )
+
+        finally:
+            processing_time = (time.time() - start_time) * 1000
+            logger.debug(
+                "Bulk learned classification lookup completed",
+                extra={
+                    "lookup_count": len(names),
+                    "hit_count": len(results),
+                    "processing_time_ms": processing_time,
+                },
+            )
+
+        return results
 
     def _check_classification_cache(
-        self, conn: sqlite3.Connection, name: str
+        self,
+        conn: sqlite3.Connection,
+        name: str,
+        normalized_name: Optional[str] = None,
+        record_access: bool = True,
     ) -> Optional[Classification]:
         """Check direct cache hit for previously learned classifications."""
 
-        import hashlib
-
-        name_hash = hashlib.sha256(name.lower().strip().encode()).hexdigest()
+        if normalized_name is None:
+            normalized_name = name.lower().strip()
 
         result = conn.execute(
             """
             SELECT best_ethnicity, confidence, classification_method
             FROM classification_cache 
-            WHERE name_hash = ? 
+            WHERE normalized_name = ? 
                 AND cached_timestamp > datetime('now', '-' || cache_ttl_hours || ' hours')
         """,
-            (name_hash,),
+            (normalized_name,),
         ).fetchone()
 
         if result:
             ethnicity, confidence, method = result
 
             # Update access count and timestamp
-            conn.execute(
-                """
-                UPDATE classification_cache 
-                SET access_count = access_count + 1,
-                    last_accessed = CURRENT_TIMESTAMP
-                WHERE name_hash = ?
-            """,
-                (name_hash,),
-            )
+            if record_access:
+                with self._write_lock, conn:
+                    conn.execute(
+                        """
+                        UPDATE classification_cache 
+                        SET access_count = access_count + 1,
+                            last_accessed = CURRENT_TIMESTAMP
+                        WHERE normalized_name = ?
+                    """,
+                        (normalized_name,),
+                    )
 
             logger.info(
                 "Direct cache hit found",
@@ -503,18 +1088,14 @@ class LLMLearningDatabase:
     ):
         """Update classification cache with new LLM result."""
 
-        import hashlib
-
-        name_hash = hashlib.sha256(record.normalized_name.encode()).hexdigest()
-
         conn.execute(
             """
             INSERT OR REPLACE INTO classification_cache 
-            (name_hash, original_name, best_ethnicity, confidence, 
+            (normalized_name, original_name, best_ethnicity, confidence, 
              classification_method, cache_ttl_hours)
             VALUES (?, ?, ?, ?, 'llm_cached', 8760)
         """,
-            (name_hash, record.name, record.ethnicity, record.confidence),
+            (record.normalized_name, record.name, record.ethnicity, record.confidence),
         )
 
     def _normalize_name_for_phonetics(self, name: str) -> str:
@@ -542,22 +1123,25 @@ class LLMLearningDatabase:
 
         return normalized
 
-    def _find_phonetic_family_match(
-        self, conn: sqlite3.Connection, name: str
-    ) -> Optional[Classification]:
-        """Find classification using phonetic family matching."""
+    def _phonetic_lookup_codes(self, name: str) -> Optional[Tuple[str, str]]:
+        """Return the (soundex, metaphone) codes used to look a name up.
+
+        Returns None when the codes cannot be generated for the name.
+        """
 
         # Normalize name for phonetic algorithms
         normalized_name = self._normalize_name_for_phonetics(name)
 
-        # Generate phonetic codes for input name using jellyfish directly
+        # Generate phonetic codes for input name using jellyfish directly.
+        # Only soundex and metaphone are queried, but names the other two
+        # algorithms reject have never matched a family.
         try:
             import jellyfish
 
             soundex_code = jellyfish.soundex(normalized_name)
             metaphone_code = jellyfish.metaphone(normalized_name)
-            nysiis_code = jellyfish.nysiis(normalized_name)
-            match_rating_code = jellyfish.match_rating_codex(normalized_name)
+            jellyfish.nysiis(normalized_name)
+            jellyfish.match_rating_codex(normalized_name)
         except ImportError:
             logger.warning("Jellyfish not available for phonetic matching")
             return None
@@ -567,47 +1151,98 @@ class LLMLearningDatabase:
             )
             return None
 
-        # Find matching phonetic families
-        families = conn.execute(
-            """
-            SELECT ethnicity, confidence, member_count, representative_names
+        return soundex_code, metaphone_code
+
+    def _fetch_phonetic_families(
+        self,
+        conn: sqlite3.Connection,
+        soundex_codes: List[str],
+        metaphone_codes: List[str],
+        limit: int = -1,
+    ) -> List[Tuple[str, str, str, float, int]]:
+        """Fetch confident families matching any of the codes, best first.
+
+        Rows are ``(soundex_code, metaphone_code, ethnicity, confidence,
+        member_count)``; a negative ``limit`` returns all of them.
+        """
+
+        soundex_placeholders = ",".join("?" * len(soundex_codes))
+        metaphone_placeholders = ",".join("?" * len(metaphone_codes))
+        return conn.execute(
+            f"""
+            SELECT soundex_code, metaphone_code, ethnicity, confidence, member_count
             FROM phonetic_families 
-            WHERE (soundex_code = ? OR metaphone_code = ?)
+            WHERE (soundex_code IN ({soundex_placeholders})
+                   OR metaphone_code IN ({metaphone_placeholders}))
                 AND confidence > 0.6
             ORDER BY confidence DESC, member_count DESC
-            LIMIT 5
+            LIMIT ?
         """,
-            (soundex_code, metaphone_code),
+            soundex_codes + metaphone_codes + [limit],
         ).fetchall()
 
-        if families:
-            # Use best matching family
-            ethnicity, confidence, member_count, names_json = families[0]
+    def _find_phonetic_family_match(
+        self,
+        conn: sqlite3.Connection,
+        name: str,
+        phonetic_codes: Optional[Tuple[str, str]],
+    ) -> Optional[Classification]:
+        """Find classification using phonetic family matching.
 
-            # Adjust confidence based on family size and phonetic match quality
-            adjusted_confidence = confidence * min(
-                1.0, member_count / 5.0
-            )  # Boost for larger families
+        Args:
+            conn: Open database connection
+            name: Name to look up
+            phonetic_codes: The name's ``_phonetic_lookup_codes()`` result
+        """
 
-            if adjusted_confidence >= 0.5:
-                logger.info(
-                    "Phonetic family match found",
-                    extra={
-                        "matched_name": name,
-                        "matched_ethnicity": ethnicity,
-                        "family_confidence": confidence,
-                        "adjusted_confidence": adjusted_confidence,
-                        "family_size": member_count,
-                    },
-                )
+        if phonetic_codes is None:
+            return None
 
-                return Classification(
-                    name=name,
-                    ethnicity=EthnicityType(ethnicity),
-                    confidence=adjusted_confidence,
-                    method=ClassificationMethod.PHONETIC,
-                    processing_time_ms=1.0,  # Very fast phonetic lookup
-                )
+        # Find the best matching phonetic family
+        families = self._fetch_phonetic_families(
+            conn, [phonetic_codes[0]], [phonetic_codes[1]], limit=1
+        )
+        if not families:
+            return None
+
+        return self._phonetic_family_classification(name, families[0][2:])
+
+    def _phonetic_family_classification(
+        self, name: str, family: Tuple[str, float, int]
+    ) -> Optional[Classification]:
+        """Classify a name from its best family.
+
+        Args:
+            name: Name being looked up
+            family: ``(ethnicity, confidence, member_count)`` of the family
+        """
+
+        ethnicity, confidence, member_count = family
+
+        # Adjust confidence based on family size and phonetic match quality
+        adjusted_confidence = confidence * min(
+            1.0, member_count / 5.0
+        )  # Boost for larger families
+
+        if adjusted_confidence >= 0.5:
+            logger.info(
+                "Phonetic family match found",
+                extra={
+                    "matched_name": name,
+                    "matched_ethnicity": ethnicity,
+                    "family_confidence": confidence,
+                    "adjusted_confidence": adjusted_confidence,
+                    "family_size": member_count,
+                },
+            )
+
+            return Classification(
+                name=name,
+                ethnicity=EthnicityType(ethnicity),
+                confidence=adjusted_confidence,
+                method=ClassificationMethod.PHONETIC,
+                processing_time_ms=1.0,  # Very fast phonetic lookup
+            )
 
         return None
 
@@ -616,44 +1251,21 @@ class LLMLearningDatabase:
     ) -> Optional[Classification]:
         """Find classification using learned linguistic patterns."""
 
-        # Get active linguistic patterns
-        patterns = conn.execute(
-            """
-            SELECT pattern_value, target_ethnicity, confidence_score, evidence_count
-            FROM learned_patterns 
-            WHERE pattern_type = 'linguistic_marker' 
-                AND is_active = true 
-                AND confidence_score > 0.7
-            ORDER BY confidence_score DESC
-        """
-        ).fetchall()
+        name_markers = {
+            match.lastgroup for match in _LINGUISTIC_MARKER_RE.finditer(name.upper())
+        }
+        if not name_markers:
+            return None
 
-        name_upper = name.upper()
         best_match = None
         best_confidence = 0.0
 
-        for pattern_value, ethnicity, confidence, evidence_count in patterns:
-            # Check if linguistic pattern applies to this name
-            pattern_applies = False
-
-            if pattern_value == "tsonga_hl_prefix" and name_upper.startswith("HL"):
-                pattern_applies = True
-            elif pattern_value == "venda_vh_pattern" and "VH" in name_upper:
-                pattern_applies = True
-            elif pattern_value == "click_consonant" and name_upper.startswith("NX"):
-                pattern_applies = True
-            elif pattern_value == "tswana_mma_prefix" and name_upper.startswith("MMA"):
-                pattern_applies = True
-            # Add more pattern matching logic as needed
-
-            if pattern_applies:
-                # Boost confidence based on evidence count
-                evidence_boost = min(0.1, evidence_count * 0.01)
-                adjusted_confidence = confidence + evidence_boost
-
-                if adjusted_confidence > best_confidence:
-                    best_confidence = adjusted_confidence
-                    best_match = (ethnicity, adjusted_confidence)
+        for pattern_value, ethnicity, adjusted_confidence in (
+            self._get_linguistic_markers(conn)
+        ):
+            if pattern_value in name_markers and adjusted_confidence > best_confidence:
+                best_confidence = adjusted_confidence
+                best_match = (ethnicity, adjusted_confidence)
 
         if best_match and best_confidence >= 0.6:
             ethnicity, confidence = best_match
@@ -677,64 +1289,205 @@ class LLMLearningDatabase:
 
         return None
 
+    def _get_linguistic_markers(
+        self, conn: sqlite3.Connection
+    ) -> List[Tuple[str, str, float]]:
+        """Return active learned linguistic markers, loading them if needed."""
+
+        markers = self._linguistic_markers
+        if (
+            markers is None
+            or time.monotonic() - self._linguistic_markers_loaded_at
+            >= self.LOOKUP_CACHE_TTL_SECONDS
+        ):
+            generation = self._generation
+            patterns = conn.execute(
+                """
+                SELECT pattern_value, target_ethnicity, confidence_score, evidence_count
+                FROM learned_patterns 
+                WHERE pattern_type = 'linguistic_marker' 
+                    AND is_active = true 
+                    AND confidence_score > 0.7
+                ORDER BY confidence_score DESC
+            """
+            ).fetchall()
+
+            # Boost confidence based on evidence count
+            markers = [
+                (pattern_value, ethnicity, confidence + min(0.1, evidence_count * 0.01))
+                for pattern_value, ethnicity, confidence, evidence_count in patterns
+            ]
+            with self._cache_lock:
+                if self._generation == generation:
+                    self._linguistic_markers = markers
+                    self._linguistic_markers_loaded_at = time.monotonic()
+
+        return markers
+
+    def _get_prefix_trie(self, conn: sqlite3.Connection) -> Dict[Optional[str], Any]:
+        """Return the trie of learned structural prefixes, building it if needed.
+
+        Each node maps a character to its child node; the ``None`` key holds
+        ``{ethnicity: (confidence, evidence_count)}`` for prefixes ending there.
+        """
+
+        trie = self._prefix_trie
+        if (
+            trie is None
+            or time.monotonic() - self._prefix_trie_built_at
+            >= self.LOOKUP_CACHE_TTL_SECONDS
+        ):
+            generation = self._generation
+            trie = {}
+            patterns = conn.execute(
+                """
+                SELECT pattern_value, target_ethnicity, confidence_score, evidence_count
+                FROM learned_patterns
+                WHERE pattern_type IN ('structural_prefix_2', 'structural_prefix_3')
+                    AND is_active = true
+            """
+            ).fetchall()
+
+            for prefix, ethnicity, confidence, evidence_count in patterns:
+                node = trie
+                for char in prefix:
+                    node = node.setdefault(char, {})
+                node.setdefault(None, {})[ethnicity] = (confidence, evidence_count)
+
+            with self._cache_lock:
+                if self._generation == generation:
+                    self._prefix_trie = trie
+                    self._prefix_trie_built_at = time.monotonic()
+
+        return trie
+
+    def _find_prefix_pattern_match(
+        self, conn: sqlite3.Connection, name: str
+    ) -> Optional[Classification]:
+        """Find classification using the longest learned structural prefix."""
+
+        node = self._get_prefix_trie(conn)
+        longest_match = None
+        for char in name.lower().strip():
+            node = node.get(char)
+            if node is None:
+                break
+            if None in node:
+                longest_match = node[None]
+
+        # Prefixes learned for more than one ethnicity are not evidence either way
+        if not longest_match or len(longest_match) != 1:
+            return None
+
+        ((ethnicity, (confidence, evidence_count)),) = longest_match.items()
+        adjusted_confidence = confidence * min(
+            1.0, evidence_count / self.PREFIX_MATCH_FULL_EVIDENCE
+        )
+
+        if adjusted_confidence < 0.5:
+            return None
+
+        logger.info(
+            "Prefix pattern match found",
+            extra={
+                "matched_name": name,
+                "pattern_ethnicity": ethnicity,
+                "pattern_confidence": adjusted_confidence,
+                "evidence_count": evidence_count,
+            },
+        )
+
+        return Classification(
+            name=name,
+            ethnicity=EthnicityType(ethnicity),
+            confidence=adjusted_confidence,
+            method=ClassificationMethod.RULE_BASED,
+            processing_time_ms=0.5,  # In-memory trie walk
+        )
+
     def get_learning_statistics(self) -> Dict[str, Any]:
-        """Get learning system performance statistics."""
-
-        with self._db_lock:
-            with sqlite3.connect(self.db_path, timeout=30.0) as conn:
-                stats = {}
-
-                # Total stored classifications
-                total_llm = conn.execute(
-                    "SELECT COUNT(*) FROM llm_classifications"
-                ).fetchone()[0]
-                stats["total_llm_classifications"] = total_llm
-
-                # Learned patterns count
-                active_patterns = conn.execute(
-                    "SELECT COUNT(*) FROM learned_patterns WHERE is_active = true"
-                ).fetchone()[0]
-                stats["active_learned_patterns"] = active_patterns
-
-                # Phonetic families
-                phonetic_families = conn.execute(
-                    "SELECT COUNT(*) FROM phonetic_families"
-                ).fetchone()[0]
-                stats["phonetic_families"] = phonetic_families
-
-                # Recent performance (last 30 days)
-                recent_performance = conn.execute(
-                    """
-                    SELECT 
-                        COUNT(*) as total_recent,
-                        AVG(confidence) as avg_confidence,
-                        SUM(cost_usd) as total_cost
-                    FROM llm_classifications 
-                    WHERE classification_timestamp > datetime('now', '-30 days')
+        """Get learning system performance statistics.
+
+        Results are memoized until the next write through this instance or
+        until STATISTICS_CACHE_TTL_SECONDS have passed.
+        """
+
+        with self._cache_lock:
+            if (
+                self._stats_cache is not None
+                and time.monotonic() - self._stats_cached_at
+                < self.STATISTICS_CACHE_TTL_SECONDS
+            ):
+                return copy.deepcopy(self._stats_cache)
+            generation = self._generation
+
+        stats = self._compute_learning_statistics()
+        with self._cache_lock:
+            if self._generation == generation:
+                self._stats_cache = stats
+                self._stats_cached_at = time.monotonic()
+        return copy.deepcopy(stats)
+
+    def _compute_learning_statistics(self) -> Dict[str, Any]:
+        """Run the aggregate queries behind get_learning_statistics()."""
+
+        with self._connection() as conn:
+            stats = {}
+
+            # Total stored classifications
+            total_llm = conn.execute(
+                "SELECT COUNT(*) FROM llm_classifications"
+            ).fetchone()[0]
+            stats["total_llm_classifications"] = total_llm
+
+            # Learned patterns count
+            active_patterns = conn.execute(
+                "SELECT COUNT(*) FROM learned_patterns WHERE is_active = true"
+            ).fetchone()[0]
+            stats["active_learned_patterns"] = active_patterns
+
+            # Phonetic families
+            phonetic_families = conn.execute(
+                "SELECT COUNT(*) FROM phonetic_families"
+            ).fetchone()[0]
+            stats["phonetic_families"] = phonetic_families
+
+            # Recent performance (last 30 days)
+            recent_performance = conn.execute(
                 """
-                ).fetchone()
+                SELECT 
+                    COUNT(*) as total_recent,
+                    AVG(confidence) as avg_confidence,
+                    SUM(cost_usd) as total_cost
+                FROM llm_classifications 
+                WHERE classification_timestamp > datetime('now', '-30 days')
+            """
+            ).fetchone()
 
-                if recent_performance:
-                    stats["recent_30_days"] = {
-                        "total_classifications": recent_performance[0],
-                        "average_confidence": recent_performance[1] or 0.0,
-                        "total_cost_usd": recent_performance[2] or 0.0,
-                    }
+            if recent_performance:
+                stats["recent_30_days"] = {
+                    "total_classifications": recent_performance[0],
+                    "average_confidence": recent_performance[1] or 0.0,
+                    "total_cost_usd": recent_performance[2] or 0.0,
+                }
 
-                # Learning efficiency (patterns per LLM call)
-                if total_llm > 0:
-                    stats["learning_efficiency"] = active_patterns / total_llm
-                else:
-                    stats["learning_efficiency"] = 0.0
+            # Learning efficiency (patterns per LLM call)
+            if total_llm > 0:
+                stats["learning_efficiency"] = active_patterns / total_llm
+            else:
+                stats["learning_efficiency"] = 0.0
 
-                return stats
+            return stats
 
     def cleanup_old_data(self, days_to_keep: int = 365):
         """Clean up old learning data to manage database size."""
 
         cutoff_date = datetime.now() - timedelta(days=days_to_keep)
 
-        with sqlite3.connect(self.db_path, timeout=30.0) as conn:
+        # Cleanup keeps frequently used cache entries, so count every hit
+        self._flush_access_counts()
+
+        with self._write_lock, self._connection() as conn:
             # Remove old classification cache entries
             conn.execute(
                 """
@@ -763,7 +1516,13 @@ class LLMLearningDatabase:
                 (cutoff_date.isoformat(),),
             )
 
+            # Refresh planner statistics for the tables lookups query most
+            conn.execute("ANALYZE learned_patterns")
+            conn.execute("ANALYZE phonetic_families")
+
             logger.info(
                 "Learning database cleanup completed",
                 extra={"cutoff_date": cutoff_date.isoformat()},
             )
+
+        self._invalidate_caches()
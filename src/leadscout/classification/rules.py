@@ -191,11 +191,10 @@ class RuleBasedClassifier:
             return special_result
 
         # Search all dictionaries for matches
-        matches = []
-        for ethnicity, dictionary in self.dictionaries.dictionaries.items():
-            if name_lower in dictionary:
-                entry = dictionary[name_lower]
-                matches.append((ethnicity, entry))
+        matches = [
+            (entry.ethnicity, entry)
+            for entry in self.dictionaries.lookup_normalized(name_lower)
+        ]
 
         if not matches:
             return None  # No rule-based classification possible
@@ -539,11 +538,7 @@ class RuleBasedClassifier:
             return True
 
         # Check all dictionaries
-        for dictionary in self.dictionaries.dictionaries.values():
-            if name_lower in dictionary:
-                return True
-
-        return False
+        return bool(self.dictionaries.lookup_normalized(name_lower))
 
     def _is_valid_sa_compound_name(self, name_parts: List[str]) -> bool:
         """Validate 5-6 part names against known SA naming patterns.
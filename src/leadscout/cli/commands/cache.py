@@ -402,10 +402,18 @@ def export(ctx: click.Context, format: str, output: Optional[Path]) -> None:
                 df_llm = pd.read_sql_query("SELECT * FROM llm_classifications", conn)
                 df_patterns = pd.read_sql_query("SELECT * FROM learned_patterns", conn)
                 df_families = pd.read_sql_query("SELECT * FROM phonetic_families", conn)
+                # Created the first time the learning database is opened
+                has_members = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'phonetic_family_members'"
+                ).fetchone()
+                df_members = pd.read_sql_query(
+                    "SELECT family_id, name FROM phonetic_family_members ORDER BY rowid", conn
+                ) if has_members else pd.DataFrame(columns=["family_id", "name"])
                 
                 export_data["llm_classifications"] = df_llm.to_dict('records')
                 export_data["learned_patterns"] = df_patterns.to_dict('records')
                 export_data["phonetic_families"] = df_families.to_dict('records')
+                export_data["phonetic_family_members"] = df_members.to_dict('records')
                 
                 click.echo(f"  ✅ Learning data: {len(df_llm)} classifications, {len(df_patterns)} patterns")
                 conn.close()
@@ -162,7 +162,10 @@ def enrich(
                     results.append(error_row)
         
         # Run async processing
-        asyncio.run(process_leads())
+        try:
+            asyncio.run(process_leads())
+        finally:
+            classifier.close()
         
         # Calculate performance metrics
         processing_time = time.time() - start_time
@@ -42,6 +42,7 @@ Usage:
 import asyncio
 import os
 import uuid
+from collections import Counter
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from datetime import datetime
@@ -128,9 +129,9 @@ class ResumableJobRunner:
         self.learning_db = LLMLearningDatabase()
         self.job_session_id = f"job_{int(time.time())}"
         
-        # Performance tracking
+        # Performance tracking (a Counter so ad-hoc keys can be incremented too)
         self.start_time = None
-        self.processing_stats = {
+        self.processing_stats = Counter({
             'batches_processed': 0,
             'leads_processed': 0,
             'api_calls_made': 0,
@@ -141,7 +142,7 @@ class ResumableJobRunner:
             'learned_pattern_hits': 0,
             'new_patterns_generated': 0,
             'cost_saved': 0.0
-        }
+        })
         
         logger.info("ResumableJobRunner initialized",
                    input_file=str(input_file),
@@ -225,6 +226,11 @@ class ResumableJobRunner:
                 logger.info("Processing lock released", job_id=self.job_id)
             except Exception as e:
                 logger.warning("Failed to release lock", error=str(e))
+
+            # 8. Close learning database connections opened by worker threads
+            if self.classifier:
+                self.classifier.close()
+            self.learning_db.close()
     
     async def _process_job(self, job: JobExecution):
         """Main job processing loop with batching and error handling.
@@ -555,7 +561,7 @@ class ResumableJobRunner:
         # ENHANCEMENT 1: Immediate learning - no batch flushing needed
         # Learning records are stored immediately during classification
         # This provides real-time pattern availability for cost optimization
-        if self.classifier and hasattr(self.classifier, '_immediate_learning_enabled'):
+        if self.classifier and getattr(self.classifier, 'flush_is_noop', False):
             logger.debug("Immediate learning active - patterns available for next leads",
                         batch_number=batch_number)
         else:
@@ -864,7 +870,8 @@ class ResumableJobRunner:
         
         try:
             # Calculate learning metrics from batch results
-            llm_calls = sum(1 for r in batch_results if r.api_provider in ['openai', 'anthropic'])
+            provider_counts = Counter(r.api_provider for r in batch_results)
+            llm_calls = provider_counts['openai'] + provider_counts['anthropic']
             learned_pattern_hits = 0  # This would need to be tracked in classification results
             new_patterns_generated = 0  # This would be tracked by classification system
             cost_saved = learned_pattern_hits * 0.002  # Estimated cost per LLM call
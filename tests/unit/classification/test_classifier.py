@@ -5,12 +5,14 @@ phonetic, and LLM classification methods in a unified pipeline.
 """
 
 import asyncio
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from leadscout.classification.classifier import NameClassifier, create_classifier
 from leadscout.classification.dictionaries import EthnicityType
+from leadscout.classification.learning_database import LLMLearningDatabase
 from leadscout.classification.models import (
     Classification,
     ClassificationMethod,
@@ -113,6 +115,148 @@ class TestNameClassifier:
             assert result.ethnicity == EthnicityType.AFRICAN
             mock_llm.classify_name.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_llm_result_stored_for_learning_before_returning(self):
+        """Test that an LLM hit is written to the learning database before it is returned."""
+        mock_llm = AsyncMock()
+        mock_llm.classify_name.return_value = Classification(
+            name="Qqqzzx",
+            ethnicity=EthnicityType.AFRICAN,
+            confidence=0.9,
+            method=ClassificationMethod.LLM,
+        )
+        self.classifier.llm_classifier = mock_llm
+        self.classifier._llm_enabled = True
+
+        with patch.object(
+            self.classifier.learning_db, 'find_learned_classification', return_value=None
+        ), patch.object(
+            self.classifier.learning_db, 'store_llm_classification', return_value=True
+        ) as mock_store:
+            result = await self.classifier.classify_name("Qqqzzx")
+
+        assert result.method == ClassificationMethod.LLM
+        mock_store.assert_called_once()
+        assert mock_store.call_args.args[0].normalized_name == "qqqzzx"
+        assert self.classifier.current_session.llm_learning_stores == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_sends_unresolved_names_to_llm_in_one_pass(self):
+        """Test that batch names missed by every local layer share one LLM pass."""
+        mock_llm = AsyncMock()
+        mock_llm.classify_name.side_effect = lambda name, context=None: Classification(
+            name=name,
+            ethnicity=EthnicityType.AFRICAN,
+            confidence=0.9 if name == "Qqqzzx" else 0.2,
+            method=ClassificationMethod.LLM,
+        )
+        self.classifier.llm_classifier = mock_llm
+        self.classifier._llm_enabled = True
+
+        with patch.object(
+            self.classifier.learning_db, 'find_learned_classifications_bulk', return_value={}
+        ), patch.object(
+            self.classifier.learning_db, 'store_llm_classification', return_value=True
+        ), patch.object(
+            self.classifier, '_stream_llm_layer', wraps=self.classifier._stream_llm_layer
+        ) as mock_llm_batch:
+            results = await self.classifier.classify_batch(["Thabo", "Qqqzzx", "Zzxqqv"])
+
+        mock_llm_batch.assert_called_once()
+        assert mock_llm_batch.call_args.args[0] == ["Qqqzzx", "Zzxqqv"]
+        assert results[0].method != ClassificationMethod.LLM
+        assert results[1].method == ClassificationMethod.LLM
+        assert results[2] is None  # Below the LLM confidence threshold
+        assert self.classifier.current_session.llm_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_reuses_patterns_learned_earlier_in_batch(self, tmp_path):
+        """Test that a name sharing a prefix learned from an earlier LLM result skips the LLM."""
+        self.classifier.learning_db = LLMLearningDatabase(tmp_path / "llm_learning.db")
+        mock_llm = AsyncMock()
+        mock_llm.classify_name.side_effect = lambda name, context=None: Classification(
+            name=name,
+            ethnicity=EthnicityType.AFRICAN,
+            confidence=0.95,
+            method=ClassificationMethod.LLM,
+        )
+        self.classifier.llm_classifier = mock_llm
+        self.classifier._llm_enabled = True
+
+        with patch.object(self.classifier.rule_classifier, 'classify_name', return_value=None):
+            with patch.object(self.classifier.phonetic_classifier, 'classify_name', return_value=None):
+                results = await self.classifier.classify_batch(
+                    ["Xiluva Rirhandzu", "Xilani Mbeki"], max_concurrent=1
+                )
+
+        self.classifier.close()
+        assert mock_llm.classify_name.await_count == 1
+        assert results[0].method == ClassificationMethod.LLM
+        assert results[1].method != ClassificationMethod.LLM
+        assert results[1].ethnicity == EthnicityType.AFRICAN
+        assert self.classifier.current_session.learned_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_classify_stream_yields_every_position(self):
+        """Test that the stream yields one result per input position, local hits first."""
+        with patch.object(
+            self.classifier.learning_db, 'find_learned_classifications_bulk', return_value={}
+        ):
+            streamed = [
+                item
+                async for item in self.classifier.classify_stream(
+                    ["Qqqzzx", "Thabo", "thabo"]
+                )
+            ]
+
+        assert [index for index, _ in streamed] == [1, 2, 0]
+        assert streamed[0][1].name == "Thabo"
+        assert streamed[1][1].name == "thabo"
+        assert streamed[2][1] is None
+
+    @pytest.mark.asyncio
+    async def test_high_confidence_mode_rejects_mid_confidence_llm_result(self):
+        """Test that the high-confidence floor also applies to the LLM layer."""
+        from leadscout.classification.exceptions import ConfidenceThresholdError
+
+        mock_llm = AsyncMock()
+        mock_llm.classify_name.return_value = Classification(
+            name="Qqqzzx",
+            ethnicity=EthnicityType.AFRICAN,
+            confidence=0.7,
+            method=ClassificationMethod.LLM,
+        )
+        self.classifier.llm_classifier = mock_llm
+        self.classifier._llm_enabled = True
+
+        with patch.object(
+            self.classifier.learning_db, 'find_learned_classification', return_value=None
+        ), patch.object(
+            self.classifier.learning_db, 'store_llm_classification', return_value=True
+        ):
+            assert (await self.classifier.classify_name("Qqqzzx")).confidence == 0.7
+            with pytest.raises(ConfidenceThresholdError):
+                await self.classifier.classify_name(
+                    "Qqqzzx", require_high_confidence=True
+                )
+
+    def test_repeat_learning_store_skipped(self):
+        """Test that storing the same LLM result twice in a row writes it once."""
+        classification = Classification(
+            name="Qqqzzx",
+            ethnicity=EthnicityType.AFRICAN,
+            confidence=0.9,
+            method=ClassificationMethod.LLM,
+        )
+
+        with patch.object(
+            self.classifier.learning_db, 'store_llm_classification', return_value=True
+        ) as mock_store:
+            self.classifier._store_llm_classification_immediately("Qqqzzx", classification)
+            self.classifier._store_llm_classification_immediately("QQQZZX ", classification)
+
+        mock_store.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_classify_empty_name_raises_error(self):
         """Test that empty names raise validation error."""
@@ -153,6 +297,145 @@ class TestNameClassifier:
                 assert result.ethnicity == EthnicityType.INDIAN
                 mock_phonetic.assert_called_once_with("TestName")
 
+    @pytest.mark.asyncio
+    async def test_learned_lookup_used_when_phonetic_misses(self):
+        """Test that the overlapped learned lookup supplies the result on a phonetic miss."""
+        learned_result = Classification(
+            name="TestName",
+            ethnicity=EthnicityType.AFRICAN,
+            confidence=0.9,
+            method=ClassificationMethod.CACHE,
+        )
+
+        with patch.object(self.classifier.rule_classifier, 'classify_name', return_value=None):
+            with patch.object(self.classifier.phonetic_classifier, 'classify_name', return_value=None):
+                with patch.object(
+                    self.classifier.learning_db, 'find_learned_classification', return_value=learned_result
+                ) as mock_learned:
+
+                    result = await self.classifier.classify_name("TestName")
+
+                    assert result is learned_result
+                    assert self.classifier.current_session.learned_hits == 1
+                    mock_learned.assert_called_once_with("TestName", "testname", False)
+
+    @pytest.mark.asyncio
+    async def test_learned_lookup_starts_before_phonetic_returns(self):
+        """Test that the learned lookup runs while the phonetic layer is working."""
+        lookup_started = threading.Event()
+        started_before_phonetic_returned = []
+
+        def learned_lookup(name, normalized_name, record_access):
+            lookup_started.set()
+            return None
+
+        def phonetic(name):
+            # The phonetic layer never yields to the event loop, so the lookup
+            # can only have started if it was already submitted to a thread
+            started_before_phonetic_returned.append(lookup_started.wait(timeout=5))
+            return None
+
+        with patch.object(self.classifier.rule_classifier, 'classify_name', return_value=None):
+            with patch.object(self.classifier.phonetic_classifier, 'classify_name', side_effect=phonetic):
+                with patch.object(
+                    self.classifier.learning_db, 'find_learned_classification', side_effect=learned_lookup
+                ):
+
+                    result = await self.classifier.classify_name("TestName")
+
+                    assert result is None
+                    assert started_before_phonetic_returned == [True]
+
+    def _use_learning_db_with_cached_name(self, tmp_path):
+        """Point the classifier at a fresh learning database caching 'TestName'."""
+        learning_db = LLMLearningDatabase(tmp_path / "llm_learning.db")
+        with learning_db._connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO classification_cache
+                (normalized_name, original_name, best_ethnicity, confidence,
+                 classification_method, cache_ttl_hours)
+                VALUES ('testname', 'TestName', 'african', 0.9, 'llm_cached', 8760)
+            """
+            )
+        self.classifier.learning_db = learning_db
+
+        def access_count():
+            learning_db.close()  # Writes pending access counts
+            return learning_db._connection().execute(
+                "SELECT access_count FROM classification_cache"
+            ).fetchone()[0]
+
+        return access_count
+
+    @pytest.mark.asyncio
+    async def test_speculative_lookup_does_not_count_discarded_cache_hit(self, tmp_path):
+        """Test that a phonetic hit leaves the learned cache entry's access_count unchanged."""
+        access_count = self._use_learning_db_with_cached_name(tmp_path)
+        learning_db = self.classifier.learning_db
+        lookup_done = threading.Event()
+        lookup_results = []
+
+        def learned_lookup(*args):
+            lookup_results.append(LLMLearningDatabase.find_learned_classification(learning_db, *args))
+            lookup_done.set()
+            return lookup_results[-1]
+
+        def phonetic(name):
+            # Let the speculative lookup finish before phonetic wins
+            assert lookup_done.wait(timeout=5)
+            return Classification(
+                name=name,
+                ethnicity=EthnicityType.INDIAN,
+                confidence=0.9,
+                method=ClassificationMethod.PHONETIC,
+            )
+
+        with patch.object(self.classifier.rule_classifier, 'classify_name', return_value=None):
+            with patch.object(self.classifier.phonetic_classifier, 'classify_name', side_effect=phonetic):
+                with patch.object(learning_db, 'find_learned_classification', side_effect=learned_lookup):
+                    result = await self.classifier.classify_name("TestName")
+
+        assert result.method == ClassificationMethod.PHONETIC
+        assert lookup_results[0].method == ClassificationMethod.CACHE
+        assert access_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_accepted_learned_cache_hit_counted_once(self, tmp_path):
+        """Test that a speculative cache hit is counted once the classifier uses it."""
+        access_count = self._use_learning_db_with_cached_name(tmp_path)
+
+        with patch.object(self.classifier.rule_classifier, 'classify_name', return_value=None):
+            with patch.object(self.classifier.phonetic_classifier, 'classify_name', return_value=None):
+                result = await self.classifier.classify_name("TestName")
+
+        assert result.method == ClassificationMethod.CACHE
+        assert access_count() == 1
+
+    @pytest.mark.asyncio
+    async def test_phonetic_hit_takes_precedence_over_learned_lookup(self):
+        """Test that a phonetic hit wins even though the learned lookup also ran."""
+        phonetic_result = Classification(
+            name="TestName",
+            ethnicity=EthnicityType.INDIAN,
+            confidence=0.7,
+            method=ClassificationMethod.PHONETIC,
+        )
+        learned_result = phonetic_result.model_copy(
+            update={"ethnicity": EthnicityType.AFRICAN, "method": ClassificationMethod.CACHE}
+        )
+
+        with patch.object(self.classifier.rule_classifier, 'classify_name', return_value=None):
+            with patch.object(self.classifier.phonetic_classifier, 'classify_name', return_value=phonetic_result):
+                with patch.object(
+                    self.classifier.learning_db, 'find_learned_classification', return_value=learned_result
+                ):
+
+                    result = await self.classifier.classify_name("TestName")
+
+                    assert result is phonetic_result
+                    assert self.classifier.current_session.learned_hits == 0
+
     @pytest.mark.asyncio
     async def test_confidence_threshold_filtering(self):
         """Test that low confidence results are filtered out."""
@@ -255,6 +538,78 @@ class TestNameClassifier:
             assert results[1] is None  # Should be None due to error
             assert results[2] is not None or results[2] is None  # May or may not find
 
+    @pytest.mark.asyncio
+    async def test_batch_only_schedules_names_local_layers_miss(self):
+        """Test that batch names resolved by rules never reach the learned/LLM layers."""
+        with patch.object(
+            self.classifier.learning_db, 'find_learned_classifications_bulk', return_value={}
+        ) as mock_learned:
+            results = await self.classifier.classify_batch(["Thabo", "Qqqzzx", "   "])
+
+        assert results[0] is not None
+        assert results[1] is None
+        assert results[2] is None  # Invalid name
+        mock_learned.assert_called_once_with(["Qqqzzx"])
+        assert self.classifier.current_session.names_processed == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_learned_layer_uses_bulk_lookup(self):
+        """Test that batch names local layers miss are resolved by one bulk lookup."""
+        learned_result = Classification(
+            name="Qqqzzx",
+            ethnicity=EthnicityType.AFRICAN,
+            confidence=0.9,
+            method=ClassificationMethod.CACHE,
+        )
+
+        with patch.object(
+            self.classifier.learning_db,
+            'find_learned_classifications_bulk',
+            return_value={"Qqqzzx": learned_result},
+        ) as mock_bulk, patch.object(
+            self.classifier.learning_db, 'find_learned_classification'
+        ) as mock_single:
+            results = await self.classifier.classify_batch(["Qqqzzx", "Zzxqqv"])
+
+        mock_bulk.assert_called_once_with(["Qqqzzx", "Zzxqqv"])
+        mock_single.assert_not_called()
+        assert results == [learned_result, None]
+        assert self.classifier.current_session.learned_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_classifies_duplicate_names_once(self):
+        """Test that repeated names in a batch share one classification."""
+        progress_calls = []
+
+        with patch.object(
+            self.classifier.learning_db, 'find_learned_classifications_bulk', return_value={}
+        ) as mock_learned:
+            results = await self.classifier.classify_batch(
+                ["Qqqzzx", "Thabo", "QQQZZX ", "thabo"],
+                progress_callback=lambda current, total: progress_calls.append(
+                    (current, total)
+                ),
+            )
+
+        mock_learned.assert_called_once_with(["Qqqzzx"])
+        assert results[0] is None and results[2] is None
+        assert results[1].ethnicity == results[3].ethnicity
+        assert results[1].name == "Thabo"
+        assert results[3].name == "thabo"
+        assert self.classifier.current_session.names_processed == 2
+        assert progress_calls[-1] == (4, 4)
+
+    def test_session_error_history_is_bounded(self):
+        """Test that the session keeps recent error messages but counts them all."""
+        session = self.classifier.current_session
+
+        for i in range(150):
+            session.record_error(f"Rule error: {i}")
+
+        assert session.error_count == 150
+        assert len(session.errors) == 100
+        assert session.errors[0] == "Rule error: 50"
+
     def test_session_stats_tracking(self):
         """Test session statistics tracking."""
         initial_stats = self.classifier.get_session_stats()
@@ -286,6 +641,35 @@ class TestNameClassifier:
         assert new_stats.total_classifications == 0
         assert isinstance(old_stats.total_classifications, int)
 
+    @pytest.mark.asyncio
+    async def test_close_releases_learning_db_connections(self):
+        """Test that close() releases connections opened by worker threads."""
+        await self.classifier.classify_name("Qqqzzx")  # Learned lookup in a thread
+        assert self.classifier.learning_db._connections
+
+        self.classifier.close()
+
+        assert not self.classifier.learning_db._connections
+
+    def test_flush_is_noop_with_immediate_learning(self):
+        """Test that flushing is a no-op while immediate learning is active."""
+        assert self.classifier.flush_is_noop
+        assert self.classifier.flush_pending_learning_records() == 0
+
+        self.classifier._immediate_learning_enabled = False
+        assert not self.classifier.flush_is_noop
+
+    def test_detect_sa_linguistic_patterns(self):
+        """Test prefix and infix South African linguistic pattern detection."""
+        detect = self.classifier._detect_sa_linguistic_patterns
+
+        assert detect("Hlungwani") == ["tsonga_hl_prefix"]
+        assert detect("MAKHUBELA") == ["sotho_ma_pattern"]
+        assert detect("Mulaudzi") == ["venda_mul_prefix"]
+        assert detect("Tshivhase") == ["venda_vh_pattern"]
+        assert detect("Mkhize Ngubane") == ["zulu_mk_pattern", "bantu_ngu_pattern"]
+        assert detect("Smith") == []
+
     def test_get_system_info(self):
         """Test system information retrieval."""
         info = self.classifier.get_system_info()
@@ -1,11 +1,17 @@
 """Unit tests for SA name dictionaries."""
 
+import dataclasses
+import json
 
+import pytest
+
+from leadscout.classification import dictionaries as dictionaries_module
 from leadscout.classification.dictionaries import (
     EthnicityType,
     NameDictionaries,
     NameEntry,
     get_dictionaries,
+    normalize_name_key,
 )
 
 
@@ -157,14 +163,74 @@ class TestNameDictionaries:
         assert metadata is not None
         assert metadata.name == "Cassiem"
         assert metadata.primary_ethnicity == EthnicityType.CAPE_MALAY
-        assert len(metadata.matches) == 1
+        assert metadata.matches == (self.dictionaries.lookup_name("Cassiem"),)
         assert not metadata.conflicting_origins
 
+    def test_get_name_metadata_multiple_matches(self):
+        """Test that a name listed under several ethnicities reports all of them."""
+        metadata = self.dictionaries.get_name_metadata("Abrahams")
+        assert metadata is not None
+        assert {m.ethnicity for m in metadata.matches} == {
+            EthnicityType.CAPE_MALAY,
+            EthnicityType.COLOURED,
+        }
+        assert metadata.primary_ethnicity == EthnicityType.CAPE_MALAY
+        assert metadata.conflicting_origins
+
+    def test_update_dictionary_visible_to_lookups(self):
+        """Test that administratively added names are found by cross-dictionary lookups."""
+        self.dictionaries.update_dictionary(
+            EthnicityType.CHINESE,
+            [NameEntry(name="Qqqzzx", ethnicity=EthnicityType.CHINESE, confidence=0.9)],
+        )
+        result = self.dictionaries.lookup_name("QQQZZX")
+        assert result is not None
+        assert result.ethnicity == EthnicityType.CHINESE
+
     def test_get_name_metadata_no_match(self):
         """Test getting metadata for unknown name."""
         metadata = self.dictionaries.get_name_metadata("UnknownName")
         assert metadata is None
 
+    def test_lookup_normalized(self):
+        """Test lookups by a key normalized once with normalize_name_key."""
+        key = normalize_name_key("  ABRAHAMS ")
+        assert key == "abrahams"
+
+        entries = self.dictionaries.lookup_normalized(key)
+        assert {entry.ethnicity for entry in entries} == {
+            EthnicityType.CAPE_MALAY,
+            EthnicityType.COLOURED,
+        }
+        assert self.dictionaries.lookup_normalized("Abrahams") == ()
+
+    def test_warmup_prefills_normalization_cache(self):
+        """Test that frequent names are normalized when dictionaries load."""
+        normalize_name_key.cache_clear()
+        NameDictionaries(warmup=False)
+        assert normalize_name_key.cache_info().currsize == 0
+
+        dictionaries = NameDictionaries()
+        warmed = normalize_name_key.cache_info().currsize
+        assert warmed > 0
+
+        assert dictionaries.get_name_metadata("DLAMINI") is not None
+        assert normalize_name_key.cache_info().currsize == warmed
+
+    def test_prefix_matches(self):
+        """Test prefix lookups across all dictionaries."""
+        names = [entry.name for entry in self.dictionaries.prefix_matches("MTH")]
+        assert names == ["Mthathi", "Mthembu", "Mthobeli"]
+
+        assert len(self.dictionaries.prefix_matches("m", limit=5)) == 5
+        assert self.dictionaries.prefix_matches("Qqq") == []
+
+    def test_keys_with_prefix(self):
+        """Test the sorted prefix scan over normalized names."""
+        keys = list(self.dictionaries.keys_with_prefix(" Van D"))
+        assert keys == ["van der merwe", "van der walt"]
+        assert list(self.dictionaries.keys_with_prefix("qqq")) == []
+
     def test_get_ethnicity_coverage(self):
         """Test ethnicity coverage statistics."""
         coverage = self.dictionaries.get_ethnicity_coverage()
@@ -195,6 +261,10 @@ class TestNameDictionaries:
         assert entry.frequency > 0
         assert entry.name_type in ["forename", "surname", "both"]
 
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            entry.confidence = 0.1
+
         if entry.linguistic_origin:
             assert isinstance(entry.linguistic_origin, str)
         if entry.regional_pattern:
@@ -202,6 +272,94 @@ class TestNameDictionaries:
         if entry.historical_context:
             assert isinstance(entry.historical_context, str)
 
+    def test_entry_metadata_strings_shared(self):
+        """Test that metadata repeated across name groups is one string object."""
+        surname = self.dictionaries.lookup_name("Khumalo")
+        forename = self.dictionaries.lookup_name("Sipho")
+
+        assert surname.linguistic_origin == forename.linguistic_origin == "Nguni"
+        assert surname.linguistic_origin is forename.linguistic_origin
+
+    def test_instances_share_builtin_entries_not_dictionaries(self):
+        """Test that built-in entries are reused but updates stay per instance."""
+        other = NameDictionaries()
+        assert (
+            other.dictionaries[EthnicityType.AFRICAN]["mthembu"]
+            is self.dictionaries.dictionaries[EthnicityType.AFRICAN]["mthembu"]
+        )
+
+        other.update_dictionary(
+            EthnicityType.CHINESE,
+            [NameEntry(name="Qqqzzx", ethnicity=EthnicityType.CHINESE, confidence=0.9)],
+        )
+        assert other.lookup_name("Qqqzzx") is not None
+        assert self.dictionaries.lookup_name("Qqqzzx") is None
+        assert NameDictionaries().lookup_name("Qqqzzx") is None
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_dictionaries(self, tmp_path, monkeypatch, use_orjson):
+        """Test that saved dictionaries are JSON files keyed by lowercased name.
+
+        Optional fields that are None, like Cassiem's linguistic origin, are
+        left out.
+        """
+        if use_orjson and not dictionaries_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(dictionaries_module, "ORJSON_AVAILABLE", use_orjson)
+        self.dictionaries.save_dictionaries(tmp_path)
+
+        saved = json.loads(
+            (tmp_path / "cape_malay_names.json").read_text(encoding="utf-8")
+        )
+        entry = self.dictionaries.lookup_name("Cassiem", EthnicityType.CAPE_MALAY)
+        assert saved["cassiem"] == {
+            "name": "Cassiem",
+            "ethnicity": "cape_malay",
+            "confidence": entry.confidence,
+            "frequency": entry.frequency,
+            "regional_pattern": "Western Cape",
+            "name_type": "surname",
+            "historical_context": entry.historical_context,
+        }
+        assert len(saved) == len(
+            self.dictionaries.dictionaries[EthnicityType.CAPE_MALAY]
+        )
+        assert {path.name for path in tmp_path.iterdir()} == {
+            f"{ethnicity.value}_names.json"
+            for ethnicity in self.dictionaries.dictionaries
+        }
+
+    def test_save_dictionaries_after_update(self, tmp_path):
+        """Test that repeat saves reuse encodings only for unchanged ethnicities."""
+        self.dictionaries.save_dictionaries(tmp_path)
+        african = self.dictionaries._serialized[EthnicityType.AFRICAN, False]
+
+        self.dictionaries.update_dictionary(
+            EthnicityType.CHINESE,
+            [NameEntry(name="Qqqzzx", ethnicity=EthnicityType.CHINESE, confidence=0.9)],
+        )
+        self.dictionaries.save_dictionaries(tmp_path)
+
+        saved = json.loads((tmp_path / "chinese_names.json").read_bytes())
+        assert saved["qqqzzx"]["confidence"] == 0.9
+        assert self.dictionaries._serialized[EthnicityType.AFRICAN, False] is african
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_dictionaries_pretty(self, tmp_path, monkeypatch, use_orjson):
+        """Test that pretty output is indented and compact output is not."""
+        if use_orjson and not dictionaries_module.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(dictionaries_module, "ORJSON_AVAILABLE", use_orjson)
+
+        self.dictionaries.save_dictionaries(tmp_path / "compact")
+        self.dictionaries.save_dictionaries(tmp_path / "pretty", pretty=True)
+
+        compact = (tmp_path / "compact" / "indian_names.json").read_text("utf-8")
+        pretty = (tmp_path / "pretty" / "indian_names.json").read_text("utf-8")
+        assert "\n" not in compact and '"name":"' in compact
+        assert pretty.startswith('{\n  "')
+        assert json.loads(compact) == json.loads(pretty)
+
     def test_global_dictionaries_singleton(self):
         """Test that get_dictionaries returns singleton instance."""
         dict1 = get_dictionaries()
@@ -0,0 +1,102 @@
+"""Unit tests for classification exceptions."""
+
+import pickle
+
+import pytest
+
+from leadscout.classification.exceptions import (
+    AugmentedRetrievalError,
+    BatchProcessingError,
+    CacheIntegrationError,
+    ClassificationError,
+    ConfidenceThresholdError,
+    ConfigurationError,
+    DictionaryError,
+    EthnicityMappingError,
+    LLMClassificationError,
+    LLMCostLimitError,
+    LLMRateLimitError,
+    MultiWordAnalysisError,
+    NameValidationError,
+    PerformanceError,
+    PhoneticMatchingError,
+    RuleClassificationError,
+    raise_invalid_name,
+)
+
+
+class TestClassificationExceptions:
+    """Test suite for the classification exception hierarchy."""
+
+    def test_attributes_stored_in_slots(self):
+        """Test that exception attributes do not allocate an instance dict."""
+        error = LLMClassificationError("failed", name="Thabo", model="test-model")
+
+        assert error.name == "Thabo"
+        assert error.method == "llm"
+        assert error.model == "test-model"
+        assert not error.__dict__
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ClassificationError("failed", name="Thabo", details={"step": 1}),
+            NameValidationError("failed", name="X1", validation_errors=["digits"]),
+            DictionaryError("failed", dictionary_type="african"),
+            RuleClassificationError("failed", name="Thabo"),
+            PhoneticMatchingError("failed", name="Thabo", failed_algorithms=["nysiis"]),
+            LLMClassificationError("failed", name="Thabo", model="test-model"),
+            LLMRateLimitError("failed", retry_after_seconds=30),
+            LLMCostLimitError("failed", current_cost=2.5, cost_limit=2.0, tokens_used=900),
+            CacheIntegrationError("failed", cache_operation="get", name="Thabo"),
+            BatchProcessingError(
+                "failed", batch_size=10, processed_count=8, failed_names=["A", "B"]
+            ),
+            ConfidenceThresholdError(
+                "failed",
+                name="Thabo",
+                achieved_confidence=0.4,
+                required_confidence=0.8,
+                method="phonetic",
+            ),
+            AugmentedRetrievalError(
+                "failed",
+                name="Thabo",
+                search_method="vector",
+                examples_found=1,
+                minimum_required=3,
+            ),
+            MultiWordAnalysisError(
+                "failed", name="Thabo Mbeki", name_parts=["Thabo"], individual_errors=[]
+            ),
+            EthnicityMappingError("failed", source_ethnicity="x", target_system="y"),
+            ConfigurationError("failed", config_section="llm"),
+            PerformanceError(
+                "failed",
+                operation="classify",
+                actual_time_ms=20.0,
+                target_time_ms=10.0,
+                performance_impact="high",
+            ),
+        ],
+        ids=lambda error: type(error).__name__,
+    )
+    def test_pickle_round_trip_keeps_attributes(self, error):
+        """Test that every exception type survives pickling with its attributes."""
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is type(error)
+        assert str(restored) == "failed"
+        for cls in type(error).__mro__:
+            for slot in cls.__dict__.get("__slots__", ()):
+                if slot != "__weakref__":
+                    assert getattr(restored, slot) == getattr(error, slot)
+
+    def test_raise_invalid_name(self):
+        """Test the invalid-name convenience function."""
+        with pytest.raises(NameValidationError) as exc_info:
+            raise_invalid_name("X1", "contains digits")
+
+        assert str(exc_info.value) == "Invalid name 'X1': contains digits"
+        assert exc_info.value.name == "X1"
+        assert exc_info.value.validation_errors == ["contains digits"]
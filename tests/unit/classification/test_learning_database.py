@@ -0,0 +1,470 @@
+"""Unit tests for the LLM learning database.
+
+Tests storage of LLM classifications and the learned-pattern lookups that let
+later leads reuse earlier LLM results without another API call.
+"""
+
+import hashlib
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from leadscout.classification.dictionaries import EthnicityType
+from leadscout.classification.learning_database import (
+    LLMClassificationRecord,
+    LLMLearningDatabase,
+)
+from leadscout.classification.models import ClassificationMethod
+
+
+def make_record(
+    name: str, ethnicity: str = "african", confidence: float = 0.95
+) -> LLMClassificationRecord:
+    """Build a learning record the way the classifier does for an LLM hit."""
+    return LLMClassificationRecord(
+        name=name,
+        normalized_name=name.lower().strip(),
+        ethnicity=ethnicity,
+        confidence=confidence,
+        llm_provider="test-model",
+        processing_time_ms=100.0,
+        cost_usd=0.001,
+        phonetic_codes={
+            "soundex": "X000",
+            "metaphone": "XTEST",
+            "nysiis": "XTAST",
+            "match_rating_codex": "XTST",
+        },
+        linguistic_patterns=[],
+        structural_features={
+            "prefix_2": name[:2].lower(),
+            "prefix_3": name[:3].lower(),
+        },
+        classification_timestamp=datetime.now(),
+        session_id="test_session",
+    )
+
+
+class TestLLMLearningDatabase:
+    """Test suite for LLMLearningDatabase."""
+
+    @pytest.fixture
+    def learning_db(self):
+        """Create a learning database in a temporary directory."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db = LLMLearningDatabase(Path(temp_dir) / "llm_learning.db")
+            yield db
+            db.close()
+
+    def test_connection_reused_per_thread(self, learning_db):
+        """Test that each thread keeps one connection until close()."""
+        conn = learning_db._connection()
+        assert learning_db._connection() is conn
+
+        other = []
+        thread = threading.Thread(
+            target=lambda: other.append(learning_db._connection())
+        )
+        thread.start()
+        thread.join()
+        assert other[0] is not conn
+
+        learning_db.close()
+        assert learning_db._connection() is not conn
+        assert learning_db.get_learning_statistics()["total_llm_classifications"] == 0
+
+    def test_finished_threads_connections_closed(self, learning_db):
+        """Test that opening a connection closes those of exited threads."""
+        opened = []
+        for _ in range(2):
+            thread = threading.Thread(
+                target=lambda: opened.append(learning_db._connection())
+            )
+            thread.start()
+            thread.join()
+
+        conns = [conn for _, conn in learning_db._connections]
+        assert conns == [learning_db._connection(), opened[1]]
+        with pytest.raises(sqlite3.ProgrammingError):
+            opened[0].execute("SELECT 1")
+
+    def test_reads_do_not_wait_for_writers(self, learning_db):
+        """Test that lookups and statistics run while the write lock is held."""
+        learning_db.store_llm_classification(make_record("Xiluva Rirhandzu"))
+        results = []
+
+        def read():
+            results.append(learning_db.find_learned_classification("Xilani Mbeki"))
+            results.append(learning_db.get_learning_statistics())
+
+        with learning_db._write_lock:
+            reader = threading.Thread(target=read)
+            reader.start()
+            reader.join(timeout=5)
+            assert not reader.is_alive()
+
+        assert results[0].ethnicity == EthnicityType.AFRICAN
+        assert results[1]["total_llm_classifications"] == 1
+
+    def test_store_and_find_cached_classification(self, learning_db):
+        """Test that a stored LLM result is found as a direct cache hit."""
+        assert learning_db.store_llm_classification(make_record("Xiluva Rirhandzu"))
+
+        result = learning_db.find_learned_classification("Xiluva Rirhandzu")
+
+        assert result is not None
+        assert result.ethnicity == EthnicityType.AFRICAN
+        assert result.method == ClassificationMethod.CACHE
+
+    def test_low_confidence_records_not_stored(self, learning_db):
+        """Test that records below min_store_confidence skip the database."""
+        assert not learning_db.store_llm_classification(
+            make_record("Xiluva Rirhandzu", confidence=0.55)
+        )
+        batch = [
+            make_record("Xilani Mbeki", confidence=0.4),
+            make_record("Rhulani Tsakani", confidence=0.6),
+        ]
+        assert learning_db.store_llm_classifications(batch) == 1
+
+        stored = learning_db._connection().execute(
+            "SELECT name FROM llm_classifications"
+        ).fetchall()
+        assert stored == [("Rhulani Tsakani",)]
+
+    def test_bulk_lookup_matches_single_lookups(self, learning_db):
+        """Test that the bulk lookup agrees with per-name lookups."""
+        learning_db.store_llm_classification(make_record("Xiluva Rirhandzu"))
+        learning_db.store_llm_classification(
+            make_record("Rhulani Tsakani", confidence=0.9)
+        )
+        names = ["Xiluva Rirhandzu", "XILUVA RIRHANDZU", "Rhulani Tsakani", "Qqq"]
+
+        bulk = learning_db.find_learned_classifications_bulk(names)
+
+        for name in names:
+            single = learning_db.find_learned_classification(name)
+            if single is None:
+                assert name not in bulk
+            else:
+                assert bulk[name].ethnicity == single.ethnicity
+                assert bulk[name].confidence == single.confidence
+                assert bulk[name].method == single.method
+        assert bulk["XILUVA RIRHANDZU"].name == "XILUVA RIRHANDZU"
+
+    def test_bulk_lookup_phonetic_family_match(self, learning_db):
+        """Test that bulk lookups resolve phonetic families like single lookups."""
+        record = make_record("Mabena")
+        record.phonetic_codes = {
+            "soundex": "M150",
+            "metaphone": "MBN",
+            "nysiis": "MABAN",
+            "match_rating_codex": "MBN",
+        }
+        record.structural_features = {}
+        for _ in range(2):
+            learning_db.store_llm_classification(record)
+
+        bulk = learning_db.find_learned_classifications_bulk(["Mabene", "Qqq"])
+        single = learning_db.find_learned_classification("Mabene")
+
+        assert single is not None
+        assert single.method == ClassificationMethod.PHONETIC
+        assert bulk["Mabene"].confidence == single.confidence
+        assert "Qqq" not in bulk
+
+    def test_bulk_lookup_empty_input(self, learning_db):
+        """Test that an empty name list returns an empty mapping."""
+        assert learning_db.find_learned_classifications_bulk([]) == {}
+
+    def test_store_many_matches_individual_stores(self, tmp_path, learning_db):
+        """Test that a batch store leaves the same learned state as single stores."""
+        records = [
+            make_record("Xiluva Rirhandzu", confidence=0.9),
+            make_record("Xilani Mbeki", confidence=0.8),
+            make_record("Xilin Wei", "chinese"),
+            make_record("Xiluva Rirhandzu", confidence=0.85),
+        ]
+        learning_db.STORE_BATCH_CHUNK_SIZE = 3
+        single_db = LLMLearningDatabase(tmp_path / "single.db")
+        try:
+            for record in records:
+                assert single_db.store_llm_classification(record)
+            expected = single_db._connection().execute(
+                "SELECT pattern_id, evidence_count, confidence_score "
+                "FROM learned_patterns ORDER BY pattern_id"
+            ).fetchall()
+        finally:
+            single_db.close()
+
+        assert learning_db.store_llm_classifications(records) == 4
+
+        conn = learning_db._connection()
+        patterns = conn.execute(
+            "SELECT pattern_id, evidence_count, confidence_score "
+            "FROM learned_patterns ORDER BY pattern_id"
+        ).fetchall()
+        stored = conn.execute("SELECT COUNT(*) FROM llm_classifications").fetchone()
+
+        assert patterns == expected
+        assert stored[0] == 3
+        assert learning_db.find_learned_classification("Xilin Wei") is not None
+
+    def test_store_many_empty_input(self, learning_db):
+        """Test that storing no records writes nothing."""
+        assert learning_db.store_llm_classifications([]) == 0
+
+    def test_repeated_patterns_accumulate_evidence(self, learning_db):
+        """Test that storing a pattern again updates its evidence and confidence."""
+        learning_db.store_llm_classification(
+            make_record("Xiluva Rirhandzu", confidence=0.9)
+        )
+        learning_db.store_llm_classification(
+            make_record("Xilani Mbeki", confidence=0.8)
+        )
+
+        row = learning_db._connection().execute(
+            "SELECT evidence_count, confidence_score FROM learned_patterns "
+            "WHERE pattern_id = 'structural_prefix_2_xi_african'"
+        ).fetchone()
+
+        assert row[0] == 3
+        assert row[1] == pytest.approx((0.9 * 2 + 0.8) / 3)
+
+    def test_phonetic_family_upserted_per_soundex(self, learning_db):
+        """Test that names sharing a soundex code join one family."""
+        learning_db.store_llm_classification(make_record("Xiluva Rirhandzu"))
+        learning_db.store_llm_classification(make_record("Xilani Mbeki"))
+        learning_db.store_llm_classification(make_record("Xilani Mbeki"))
+
+        conn = learning_db._connection()
+        families = conn.execute("SELECT id FROM phonetic_families").fetchall()
+        members = conn.execute(
+            "SELECT family_id, name FROM phonetic_family_members ORDER BY rowid"
+        ).fetchall()
+
+        assert len(families) == 1
+        assert members == [
+            (families[0][0], "Xiluva Rirhandzu"),
+            (families[0][0], "Xilani Mbeki"),
+        ]
+
+    def test_linguistic_markers_cached_until_write(self, learning_db):
+        """Test that learned markers are loaded once and reloaded after a write."""
+        record = make_record("Hlengiwe Baloyi", confidence=0.9)
+        record.linguistic_patterns = ["tsonga_hl_prefix"]
+        learning_db.store_llm_classification(record)
+
+        conn = learning_db._connection()
+        markers = learning_db._get_linguistic_markers(conn)
+        assert markers == [("tsonga_hl_prefix", "african", pytest.approx(0.92))]
+        assert learning_db._get_linguistic_markers(conn) is markers
+
+        learning_db.store_llm_classification(make_record("Xiluva Rirhandzu"))
+        assert learning_db._linguistic_markers is None
+
+    def test_optimize_runs_after_configured_writes(self, learning_db, monkeypatch):
+        """Test that PRAGMA optimize runs once per OPTIMIZE_AFTER_WRITES stores."""
+        optimized = []
+        monkeypatch.setattr(learning_db, "OPTIMIZE_AFTER_WRITES", 2)
+        monkeypatch.setattr(learning_db, "_optimize", optimized.append)
+
+        for name in ("Xiluva Rirhandzu", "Xilani Mbeki", "Rhulani Tsakani"):
+            learning_db.store_llm_classification(make_record(name))
+
+        assert optimized == [learning_db._connection()]
+
+    def test_cleanup_analyzes_learned_tables(self, learning_db):
+        """Test that cleanup refreshes planner statistics."""
+        learning_db.store_llm_classification(make_record("Xiluva Rirhandzu"))
+
+        learning_db.cleanup_old_data()
+
+        analyzed = {
+            row[0]
+            for row in learning_db._connection().execute(
+                "SELECT tbl FROM sqlite_stat1"
+            )
+        }
+        assert {"learned_patterns", "phonetic_families"} <= analyzed
+
+    def test_learning_statistics_memoized_until_write(self, learning_db):
+        """Test that statistics are reused until a new classification is stored."""
+        before = learning_db.get_learning_statistics()
+        before["total_llm_classifications"] = 999  # Callers get their own copy
+
+        assert learning_db.get_learning_statistics()["total_llm_classifications"] == 0
+
+        learning_db.store_llm_classification(make_record("Xiluva Rirhandzu"))
+        after = learning_db.get_learning_statistics()
+
+        assert after["total_llm_classifications"] == 1
+        assert after["active_learned_patterns"] > 0
+
+    def test_lookup_cache_serves_repeats_and_clears_on_write(self, learning_db):
+        """Test that repeated lookups are memoized and writes invalidate them."""
+        assert learning_db.find_learned_classification("Xiluva Rirhandzu") is None
+        assert "xiluva rirhandzu" in learning_db._lookup_cache
+
+        learning_db.store_llm_classification(make_record("Xiluva Rirhandzu"))
+        assert not learning_db._lookup_cache
+
+        first = learning_db.find_learned_classification("Xiluva Rirhandzu")
+        repeat = learning_db.find_learned_classification("XILUVA RIRHANDZU")
+
+        assert first is not None and repeat is not None
+        assert repeat.ethnicity == first.ethnicity
+        assert repeat.name == "XILUVA RIRHANDZU"
+        assert list(learning_db._lookup_cache) == ["xiluva rirhandzu"]
+
+    def test_memoized_cache_hits_counted_in_access_count(
+        self, learning_db, monkeypatch
+    ):
+        """Test that direct hits served from memory still count as accesses."""
+        monkeypatch.setattr(learning_db, "ACCESS_COUNT_FLUSH_HITS", 4)
+        learning_db.store_llm_classification(make_record("Xiluva Rirhandzu"))
+
+        def access_count():
+            return learning_db._connection().execute(
+                "SELECT access_count FROM classification_cache"
+            ).fetchone()[0]
+
+        for _ in range(5):
+            learning_db.find_learned_classification("Xiluva Rirhandzu")
+        assert access_count() == 5  # One database hit, four flushed together
+
+        for _ in range(5):
+            learning_db.find_learned_classification("Xiluva Rirhandzu")
+        learning_db.close()
+        assert access_count() == 10
+
+    def test_lookup_cache_expires_for_writes_by_other_instances(
+        self, learning_db, monkeypatch
+    ):
+        """Test that memoized misses expire so other writers' results show up."""
+        writer = LLMLearningDatabase(learning_db.db_path)
+        try:
+            assert learning_db.find_learned_classification("Xiluva Rirhandzu") is None
+            assert learning_db.find_learned_classification("Xilani Mbeki") is None
+
+            writer.store_llm_classification(make_record("Xiluva Rirhandzu"))
+            assert learning_db.find_learned_classification("Xiluva Rirhandzu") is None
+
+            monkeypatch.setattr(learning_db, "LOOKUP_CACHE_TTL_SECONDS", 0.0)
+            direct = learning_db.find_learned_classification("Xiluva Rirhandzu")
+            prefix = learning_db.find_learned_classification("Xilani Mbeki")
+        finally:
+            writer.close()
+
+        assert direct is not None and direct.method == ClassificationMethod.CACHE
+        assert prefix is not None and prefix.ethnicity == EthnicityType.AFRICAN
+
+    def test_lookup_cache_evicts_least_recently_used(self, learning_db):
+        """Test that the lookup cache stays within its size limit."""
+        learning_db._lookup_cache_max = 2
+
+        for name in ("Aaa", "Bbb", "Aaa", "Ccc"):
+            learning_db.find_learned_classification(name)
+
+        assert list(learning_db._lookup_cache) == ["aaa", "ccc"]
+
+    def test_prefix_pattern_match_for_unseen_name(self, learning_db):
+        """Test that a learned prefix classifies a new name sharing it."""
+        learning_db.store_llm_classification(make_record("Xiluva Rirhandzu"))
+
+        result = learning_db.find_learned_classification("Xilani Mbeki")
+
+        assert result is not None
+        assert result.ethnicity == EthnicityType.AFRICAN
+        assert result.method == ClassificationMethod.RULE_BASED
+        assert result.confidence < 0.95
+
+    def test_prefix_pattern_ignores_conflicting_prefixes(self, learning_db):
+        """Test that a prefix learned for two ethnicities does not match."""
+        learning_db.store_llm_classification(make_record("Xiluva Rirhandzu"))
+        learning_db.store_llm_classification(make_record("Xilin Wei", "chinese"))
+
+        assert learning_db.find_learned_classification("Xilani Mbeki") is None
+
+    def test_hashed_classification_cache_migrated(self, tmp_path):
+        """Test that SHA-256 keyed cache rows are re-keyed by normalized name."""
+        db_path = tmp_path / "llm_learning.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE classification_cache (
+                    name_hash TEXT PRIMARY KEY,
+                    original_name TEXT,
+                    best_ethnicity TEXT,
+                    confidence REAL,
+                    classification_method TEXT,
+                    cached_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    cache_ttl_hours INTEGER DEFAULT 8760,
+                    access_count INTEGER DEFAULT 0,
+                    last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """
+            )
+            conn.execute(
+                "INSERT INTO classification_cache (name_hash, original_name, "
+                "best_ethnicity, confidence, classification_method) "
+                "VALUES (?, 'Wei Lin', 'chinese', 0.9, 'llm_cached')",
+                (hashlib.sha256(b"wei lin").hexdigest(),),
+            )
+        conn.close()
+
+        learning_db = LLMLearningDatabase(db_path)
+        try:
+            result = learning_db.find_learned_classification("WEI LIN")
+        finally:
+            learning_db.close()
+
+        assert result is not None
+        assert result.ethnicity == EthnicityType.CHINESE
+        assert result.method == ClassificationMethod.CACHE
+
+    def test_representative_names_migrated_to_members(self, tmp_path):
+        """Test that JSON representative name lists become member rows."""
+        db_path = tmp_path / "llm_learning.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE phonetic_families (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    soundex_code TEXT,
+                    metaphone_code TEXT,
+                    double_metaphone_primary TEXT,
+                    double_metaphone_secondary TEXT,
+                    ethnicity TEXT,
+                    confidence REAL,
+                    member_count INTEGER DEFAULT 1,
+                    representative_names JSON,
+                    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """
+            )
+            conn.execute(
+                "INSERT INTO phonetic_families (soundex_code, ethnicity, confidence, "
+                "representative_names) VALUES ('M150', 'african', 0.9, ?)",
+                ('["Mabena", "Mabuza"]',),
+            )
+        conn.close()
+
+        learning_db = LLMLearningDatabase(db_path)
+        try:
+            conn = learning_db._connection()
+            members = conn.execute(
+                "SELECT name FROM phonetic_family_members ORDER BY rowid"
+            ).fetchall()
+            legacy = conn.execute(
+                "SELECT representative_names FROM phonetic_families"
+            ).fetchone()
+        finally:
+            learning_db.close()
+
+        assert members == [("Mabena",), ("Mabuza",)]
+        assert legacy == (None,)